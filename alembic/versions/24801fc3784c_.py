@@ -0,0 +1,26 @@
+"""secrets.updated_at server default
+
+Revision ID: 24801fc3784c
+Revises: d587be5c6d9d
+Create Date: 2026-10-15 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '24801fc3784c'
+down_revision: Union[str, None] = 'd587be5c6d9d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('secrets', 'updated_at', server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    op.alter_column('secrets', 'updated_at', server_default=None)
@@ -1,15 +1,14 @@
+import asyncio
 import logging
 import subprocess
-from threading import Timer
 
-from watchfiles import watch
+from watchfiles import awatch
 
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s')
 
-# Debounce timer (in seconds)
-DEBOUNCE_INTERVAL = 1.0
-
-timer = None
+# Debounce interval (in milliseconds). `awatch` groups all changes that occur within
+# this window into a single batch.
+DEBOUNCE_INTERVAL_MS = 1000
 
 def run_migrations():
     logging.info("Running `alembic upgrade head`...")
@@ -24,16 +23,12 @@ def run_migrations():
     except subprocess.CalledProcessError as e:
         logging.error("Migration failed:\n%s", e.stderr)
 
-def debounce_run():
-    global timer
-    if timer:
-        timer.cancel()
-    timer = Timer(DEBOUNCE_INTERVAL, run_migrations)
-    timer.start()
+async def main():
+    async for changes in awatch('/alembic/versions', debounce=DEBOUNCE_INTERVAL_MS, step=200):
+        logging.info("🔄 Detected file changes: %s", changes)
+        run_migrations()
 
 
 if __name__ == "__main__":
     logging.info("📡 Watching /alembic/versions for changes...")
-    for changes in watch('/alembic/versions'):
-        logging.info("🔄 Detected file changes: %s", changes)
-        debounce_run()
+    asyncio.run(main())
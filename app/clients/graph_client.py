@@ -1,13 +1,59 @@
-import asyncio
-import json
 import re
-from datetime import datetime
-from typing import Any
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import cache
+from itertools import batched
+from typing import Any, ClassVar
 
-from neo4j import AsyncDriver, Driver
-from pydantic import BaseModel, model_validator
+import orjson
+from neo4j import AsyncDriver, Driver, RoutingControl
+from pydantic import BaseModel, computed_field, model_validator
 
 from app.db.models.choices import IntegrationType
+from app.rag.types import NodeLabel
+
+# Number of rows sent per `UNWIND` statement. Neo4j recommends batches of ~1,000 rows
+# when importing data.
+BATCH_SIZE = 1000
+# Number of nodes deleted per transaction when deleting an integration
+DELETE_BATCH_SIZE = 10000
+# Number of nodes updated per transaction when backfilling `id_lc`
+BACKFILL_BATCH_SIZE = 10000
+# Max number of batches written concurrently
+MAX_CONCURRENT_BATCHES = 8
+
+# Label expression matching every node we write (e.g., `File|Person|Text`). Constraining
+# `MATCH` clauses to these labels lets the planner use the indexes created in
+# `GraphClient.create_indexes` instead of scanning every node.
+NODE_LABELS = "|".join(sorted(NodeLabel))
+
+# Matches nodes whose id starts with `$parentGroupIdPrefix`. Nodes written before
+# `id_lc` existed fall back to lowercasing `id` until `GraphClient.backfill_id_lc` has
+# run.
+_PARENT_GROUP_PREFIX_PREDICATE = (
+    "({var}.id_lc STARTS WITH $parentGroupIdPrefix"
+    " OR ({var}.id_lc IS NULL AND toLower({var}.id) STARTS WITH $parentGroupIdPrefix))"
+)
+
+# Characters escaped by `escape_neo4j_string`, and their escaped form
+_ESC_RE = re.compile(r"['\"\\]")
+_ESC_MAP = {"'": "\\'", '"': '\\"', "\\": "\\\\"}
+
+# Slack timestamps are seconds since the Unix epoch (UTC). The epoch is naive so that
+# stored timestamps keep their existing format (no `+00:00` offset).
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _escape(value: str) -> str:
+    # Most strings don't contain any characters that need escaping
+    if "'" not in value and '"' not in value and "\\" not in value:
+        return value
+    return _ESC_RE.sub(lambda m: _ESC_MAP[m.group(0)], value)
+
+
+def _escape_optional(value: str | None) -> str | None:
+    return _escape(value) if value else value
 
 
 def escape_neo4j_string(value: str | list[str]):
@@ -16,9 +62,9 @@ def escape_neo4j_string(value: str | list[str]):
     https://github.com/pinecone-io/pinecone-neo4j-explorer/blob/main/process_scotus.ipynb
     """
     if isinstance(value, str):
-        return re.sub(r"(['\"\\])", r"\\\1", value)
+        return _escape(value)
     elif isinstance(value, list):
-        return [re.sub(r"(['\"\\])", r"\\\1", v) for v in value]
+        return [_escape(v) for v in value]
     return value
 
 
@@ -28,6 +74,15 @@ class Node(BaseModel):
     labels: list[str]
     source: IntegrationType
 
+    # String properties escaped before they are written to Neo4J. Escaping happens at
+    # write time rather than in a validator, so that batches can escape column by
+    # column.
+    ESCAPED_FIELDS: ClassVar[tuple[str, ...]] = ("id", "id_lc")
+
+    # Label strings keyed by (prefix, labels). Labels are fixed per node type, so there
+    # are only a handful of entries.
+    _label_str_cache: ClassVar[dict[tuple[str, tuple[str, ...]], str]] = {}
+
     @model_validator(mode="before")
     @classmethod
     def convert_id_to_string(cls, data: Any) -> Any:
@@ -35,43 +90,87 @@ class Node(BaseModel):
             data["id"] = str(data["id"])
         return data
 
-    @model_validator(mode="after")
-    def escape_neo4j_strings(self) -> "Node":
-        self.id = escape_neo4j_string(self.id)
-        self.labels = escape_neo4j_string(self.labels)
-        return self
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def id_lc(self) -> str:
+        """Lowercase ID. Stored as an indexed property so that case-insensitive prefix
+        lookups can use `STARTS WITH` instead of a regex."""
+        return self.id.lower()
 
     @staticmethod
     def construct_label_string(labels: list[str], prefix: str = "n"):
-        label_str = ":".join(labels)
-        return f"{prefix}:{label_str}"
+        key = (prefix, tuple(labels))
+        label_str = Node._label_str_cache.get(key)
+        if label_str is None:
+            label_str = f"{prefix}:{':'.join(labels)}"
+            Node._label_str_cache[key] = label_str
+        return label_str
 
-    def create_node_query(self) -> str:
+    @staticmethod
+    @cache
+    def build_create_node_query(labels: tuple[str, ...]) -> str:
         """
+        Properties are passed as a single map parameter, so the query only depends on
+        the node's labels. There are only a handful of distinct label sets, so each
+        query is only built once and Neo4j can reuse its cached plan.
+
         See Neo4j docs:
         https://neo4j.com/docs/cypher-manual/current/clauses/merge/
         """
-        prefix = "n"
-        name_label_str = self.construct_label_string(labels=self.labels, prefix=prefix)
-
-        # Model fields
-        model_json = self.model_dump(exclude={"labels"})
-        set_fields: list[str] = []
-        for f, _ in model_json.items():
-            set_fields.append(f"{prefix}.{f} = ${f}")
-        set_str = ", ".join(set_fields)
-        query = "\n ".join(
+        name_label_str = Node.construct_label_string(labels=list(labels), prefix="n")
+        return "\n ".join(
             [
                 f"MERGE ({name_label_str} {{id: $id}})",
-                f"ON CREATE SET {set_str}",
+                "ON CREATE SET n = $props",
+                "ON MATCH SET n += $props",
             ]
         )
-        return query
 
-    def create_node(self, driver: Driver):
-        query = self.create_node_query()
-        with driver.session() as session:
-            session.run(query, **self.model_dump(exclude={"labels"}))
+    def escaped_labels(self) -> tuple[str, ...]:
+        return tuple(sorted(escape_neo4j_string(self.labels)))
+
+    def create_node_query(self) -> str:
+        return self.build_create_node_query(self.escaped_labels())
+
+    @classmethod
+    @cache
+    def property_fields(cls) -> tuple[str, ...]:
+        """Fields written as node properties. These are static per node type, so they
+        are only computed once per class."""
+        fields = [f for f in cls.model_fields if f != "labels"]
+        return (*fields, *cls.model_computed_fields)
+
+    def dump_props(self) -> dict[str, Any]:
+        """Properties written to the graph. Reading the attributes directly skips
+        Pydantic's serialization machinery, which `model_dump` would run every call.
+        """
+        return {f: getattr(self, f) for f in self.property_fields()}
+
+    def escaped_props(self) -> dict[str, Any]:
+        """Properties written to the graph, with `ESCAPED_FIELDS` escaped."""
+        props = self.dump_props()
+        for f in self.ESCAPED_FIELDS:
+            props[f] = _escape_optional(props[f])
+        return props
+
+    def to_batch_row(self) -> tuple[tuple[str, ...], dict[str, Any]]:
+        """Return the node's sorted labels and the (unescaped) properties written to the
+        graph. Nodes with the same labels can be written with a single `UNWIND`
+        statement.
+        """
+        return self.escaped_labels(), self.dump_props()
+
+    def create_node(
+        self, driver: Driver, database: str, props: dict[str, Any] | None = None
+    ):
+        # Callers that have already computed the node's properties can pass them in
+        if props is None:
+            props = self.escaped_props()
+        driver.execute_query(
+            self.create_node_query(),
+            {"id": props["id"], "props": props},
+            database_=database,
+        )
 
 
 class TextNode(Node):
@@ -81,11 +180,20 @@ class TextNode(Node):
     display_name: str
     reactions: str
 
+    ESCAPED_FIELDS = (
+        *Node.ESCAPED_FIELDS,
+        "content",
+        "ts",
+        "url",
+        "display_name",
+        "reactions",
+    )
+
     @model_validator(mode="before")
     @classmethod
     def convert_reactions_list_to_str(cls, data: dict[str, Any]):
         if "reactions" in data and isinstance(data["reactions"], list):
-            data["reactions"] = json.dumps(data["reactions"])
+            data["reactions"] = orjson.dumps(data["reactions"]).decode()
             return data
         else:
             data["reactions"] = "[]"
@@ -93,17 +201,10 @@ class TextNode(Node):
 
     @model_validator(mode="after")
     def process_text_node_attributes(self: "TextNode") -> "TextNode":
-        self.content = escape_neo4j_string(self.content)
-        self.ts = escape_neo4j_string(self.ts)
-        if self.url:
-            self.url = escape_neo4j_string(self.url)
-        self.display_name = escape_neo4j_string(self.display_name)
-        self.reactions = escape_neo4j_string(self.reactions)
-
         # Convert timestamp to UTC. We need to this on a source-by-source basis.
         if self.source == IntegrationType.SLACK:
             if self.ts:
-                self.ts = datetime.fromtimestamp(float(self.ts)).isoformat()
+                self.ts = (_EPOCH + timedelta(seconds=float(self.ts))).isoformat()
         return self
 
 
@@ -112,22 +213,13 @@ class FileNode(Node):
     mimetype: str
     url: str | None
 
-    @model_validator(mode="after")
-    def process_file_node_attributes(self: "FileNode") -> "FileNode":
-        self.name = escape_neo4j_string(self.name)
-        self.mimetype = escape_neo4j_string(self.mimetype)
-        if self.url:
-            self.url = escape_neo4j_string(self.url)
-        return self
+    ESCAPED_FIELDS = (*Node.ESCAPED_FIELDS, "name", "mimetype", "url")
 
 
 class PersonNode(Node):
     name_login: str
 
-    @model_validator(mode="after")
-    def process_person_node_attributes(self: "PersonNode") -> "PersonNode":
-        self.name_login = escape_neo4j_string(self.name_login)
-        return self
+    ESCAPED_FIELDS = (*Node.ESCAPED_FIELDS, "name_login")
 
 
 class Edge(BaseModel):
@@ -143,39 +235,83 @@ class Edge(BaseModel):
                 data[key] = str(data[key])
         return data
 
-    @model_validator(mode="after")
-    def escape_neo4j_strings(self) -> "Edge":
-        self.from_node_id = escape_neo4j_string(self.from_node_id)
-        self.to_node_id = escape_neo4j_string(self.to_node_id)
-        self.relationship_type = escape_neo4j_string(self.relationship_type)
-        return self
-
-    def create_edge_query(self):
-        return "\n ".join(
-            [
-                "MATCH (a {id: $fromNodeId}), (b {id: $toNodeId})",
-                f"MERGE (a)-[r:{self.relationship_type}]->(b)",
-            ]
-        )
-
-    def create_edge(self, driver: Driver):
-        query = self.create_edge_query()
-        with driver.session() as session:
-            session.run(
-                query,
-                fromNodeId=self.from_node_id,
-                toNodeId=self.to_node_id,
-            )
-
 
 class GraphClient:
     driver: Driver
     async_driver: AsyncDriver
-
-    def __init__(self, neo4j_driver: Driver, async_neo4j_driver: AsyncDriver):
+    database: str
+
+    def __init__(
+        self,
+        neo4j_driver: Driver,
+        async_neo4j_driver: AsyncDriver,
+        database: str = "neo4j",
+    ):
         self.driver = neo4j_driver
         self.async_driver = async_neo4j_driver
+        # Naming the database up front saves the driver a home database lookup
+        self.database = database
         self.edge_ids_map: dict[str, list[str]] = {}
+        self.create_indexes()
+
+    def create_indexes(self):
+        """Index the properties we look nodes up by. These are idempotent."""
+        for label in NodeLabel:
+            for prop in ["id", "id_lc", "url", "integration_id"]:
+                self.driver.execute_query(
+                    f"CREATE INDEX {label.lower()}_{prop} IF NOT EXISTS "
+                    f"FOR (n:{label}) ON (n.{prop})",
+                    database_=self.database,
+                )
+
+    @staticmethod
+    def _upsert_node_clauses(
+        labels: tuple[str, ...], props: str, url: str
+    ) -> list[str]:
+        """
+        If there is a node whose ID matches the node's URL, then update that node with
+        the node's attributes. Otherwise, create (or update) the node itself. Both cases
+        are handled in one statement, so that each write is a single round-trip.
+        """
+        name_label_str = Node.construct_label_string(list(labels))
+        return [
+            f"OPTIONAL MATCH (existing:{NODE_LABELS} {{id: {url}}})",
+            "FOREACH (_ IN CASE WHEN existing IS NOT NULL THEN [1] ELSE [] END |",
+            f"  SET existing += {props})",
+            "FOREACH (_ IN CASE WHEN existing IS NULL THEN [1] ELSE [] END |",
+            f"  MERGE ({name_label_str} {{id: {props}.id}})",
+            f"  ON CREATE SET n = {props}",
+            f"  ON MATCH SET n += {props})",
+        ]
+
+    @staticmethod
+    @cache
+    def build_upsert_node_query(labels: tuple[str, ...]) -> str:
+        return "\n ".join(
+            GraphClient._upsert_node_clauses(labels, props="$props", url="$nodeUrl")
+        )
+
+    @staticmethod
+    @cache
+    def build_batch_upsert_nodes_query(labels: tuple[str, ...]) -> str:
+        return "\n ".join(
+            [
+                "UNWIND $rows AS r",
+                *GraphClient._upsert_node_clauses(labels, props="r", url="r.url"),
+            ]
+        )
+
+    @staticmethod
+    @cache
+    def build_batch_create_edges_query(relationship_type: str) -> str:
+        return "\n ".join(
+            [
+                "UNWIND $rows AS row",
+                f"MATCH (a:{NODE_LABELS} {{id: row.from_id}})",
+                f"MATCH (b:{NODE_LABELS} {{id: row.to_id}})",
+                f"MERGE (a)-[r:{relationship_type}]->(b)",
+            ]
+        )
 
     def add_node(self, node: Node):
         # If the node is a text node, but the content is empty,
@@ -184,44 +320,128 @@ class GraphClient:
             if node.content == "":
                 return
 
-        # If the file has a URL, check if there is a node whose ID matches that URL. If
-        # it does, then update that node with the current node's attributes
-        if hasattr(node, "url") and node.url is not None and node.url != "":
-            set_safe_str = ",".join(
-                [
-                    f"n.{key} = ${key}"
-                    for key, _ in node.model_dump(exclude={"labels"}).items()
-                ]
-            )
-            cypher_query = (
-                f"MATCH (n) WHERE n.id = $nodeUrl SET {set_safe_str} RETURN n"
-            )
-            res = self.execute_query(
-                cypher_query, nodeUrl=node.url, **node.model_dump(exclude={"labels"})
+        props = node.escaped_props()
+        self.driver.execute_query(
+            self.build_upsert_node_query(node.escaped_labels()),
+            {"props": props, "nodeUrl": props.get("url") or None},
+            database_=self.database,
+        )
+
+    def _run_batches(
+        self, query: str, rows: list[dict[str, Any]], concurrent: bool = True
+    ) -> list[Any]:
+        """Run `query` once per batch of `rows`. If `concurrent`, up to
+        `MAX_CONCURRENT_BATCHES` batches are in flight. Returns the records from all
+        batches.
+        """
+
+        def run_batch(batch: tuple[dict[str, Any], ...]) -> list[Any]:
+            records, _, _ = self.driver.execute_query(
+                query, {"rows": list(batch)}, database_=self.database
             )
-            if res:
-                return
-            else:
-                node.create_node(self.driver)
+            return records
 
-        # Otherwise, create the node
+        batches = list(batched(rows, BATCH_SIZE, strict=False))
+        if len(batches) <= 1 or not concurrent:
+            results = [run_batch(batch) for batch in batches]
         else:
-            node.create_node(self.driver)
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES) as executor:
+                results = list(executor.map(run_batch, batches))
+        return [record for records in results for record in records]
+
+    @staticmethod
+    def _node_rows(nodes: list[Node]) -> list[tuple[tuple[str, ...], dict[str, Any]]]:
+        rows_by_cls: dict[type[Node], list[tuple[tuple[str, ...], dict[str, Any]]]] = (
+            defaultdict(list)
+        )
+        for node in nodes:
+            # Skip text nodes with empty content, same as `add_node`
+            if isinstance(node, TextNode) and node.content == "":
+                continue
+            rows_by_cls[type(node)].append(node.to_batch_row())
+
+        # Escape each node type's string properties one column at a time. Mapping the
+        # escape function over a column keeps the hot loop in C.
+        for node_cls, cls_rows in rows_by_cls.items():
+            rows = [row for _, row in cls_rows]
+            for f in node_cls.ESCAPED_FIELDS:
+                column = map(_escape_optional, [row[f] for row in rows])
+                for row, value in zip(rows, column, strict=True):
+                    row[f] = value
+        return [row for cls_rows in rows_by_cls.values() for row in cls_rows]
+
+    @staticmethod
+    def _rows_by_labels(
+        node_rows: list[tuple[tuple[str, ...], dict[str, Any]]],
+    ) -> dict[tuple[str, ...], list[dict[str, Any]]]:
+        """Group rows by label. Rows are also de-duplicated by ID, so that concurrent
+        batches never `MERGE` the same node.
+        """
+        rows_by_labels: dict[tuple[str, ...], dict[str, dict[str, Any]]] = defaultdict(
+            dict
+        )
+        for labels, row in node_rows:
+            rows_by_labels[labels][row["id"]] = row
+        return {labels: list(rows.values()) for labels, rows in rows_by_labels.items()}
+
+    @staticmethod
+    def _edge_rows(edges: list[Edge]) -> dict[str, list[dict[str, str]]]:
+        """Group rows by relationship type. Rows are also de-duplicated by their
+        endpoints, so that the same relationship is never `MERGE`d twice.
+        """
+        rows_by_type: dict[str, dict[tuple[str, str], dict[str, str]]] = defaultdict(
+            dict
+        )
+        for edge in edges:
+            from_id = _escape(edge.from_node_id)
+            to_id = _escape(edge.to_node_id)
+            rows_by_type[_escape(edge.relationship_type)][(from_id, to_id)] = {
+                "from_id": from_id,
+                "to_id": to_id,
+            }
+        return {rel: list(rows.values()) for rel, rows in rows_by_type.items()}
+
+    def add_nodes_batch(self, nodes: list[Node]):
+        """
+        Batched version of `add_node`. Nodes are grouped by their labels, and each group
+        is written via a single `UNWIND ... MERGE` statement per batch. See Neo4j docs:
+        https://neo4j.com/docs/cypher-manual/current/clauses/unwind/
+        """
+        rows_by_labels = self._rows_by_labels(self._node_rows(nodes))
+        for labels, rows in rows_by_labels.items():
+            self._run_batches(self.build_batch_upsert_nodes_query(labels), rows)
 
     def add_edge(self, edge: Edge):
-        edge.create_edge(self.driver)
+        self.add_edges_batch([edge])
+
+    def add_edges_batch(self, edges: list[Edge]):
+        """
+        Batched version of `add_edge`. Edges are grouped by their relationship type, and
+        each group is written via a single `UNWIND ... MERGE` statement per batch.
+        Unlike node batches, edge batches are written one at a time: batches that share
+        an endpoint lock the same nodes, so concurrent writes could deadlock (or create
+        duplicate relationships).
+        """
+        for relationship_type, rows in self._edge_rows(edges).items():
+            self._run_batches(
+                self.build_batch_create_edges_query(relationship_type),
+                rows,
+                concurrent=False,
+            )
 
     def get_node_count(self, parent_group_id: str) -> int:
-        parent_group_id_regex = f"(?i){parent_group_id}.*"
         query = "\n ".join(
             [
-                "MATCH (n)",
-                "WHERE n.id =~ $parentGroupIdRegex",
+                f"MATCH (n:{NODE_LABELS})",
+                f"WHERE {_PARENT_GROUP_PREFIX_PREDICATE.format(var='n')}",
                 "RETURN count(n) AS node_count;",
             ]
         )
         records, _, _ = self.driver.execute_query(
-            query, parentGroupIdRegex=parent_group_id_regex
+            query,
+            {"parentGroupIdPrefix": parent_group_id.lower()},
+            database_=self.database,
+            routing_=RoutingControl.READ,
         )
         if not records:
             return 0
@@ -229,40 +449,116 @@ class GraphClient:
             return records[0]["node_count"]
 
     def get_edge_count(self, parent_group_id: str):
-        parent_group_id_regex = f"(?i){parent_group_id}.*"
         query = "\n ".join(
             [
-                "MATCH (a)-[r]->(b)",
-                "WHERE a.id =~ $parentGroupIdRegex OR b.id =~ $parentGroupIdRegex",
+                f"MATCH (a:{NODE_LABELS})-[r]->(b:{NODE_LABELS})",
+                f"WHERE {_PARENT_GROUP_PREFIX_PREDICATE.format(var='a')}",
+                f"OR {_PARENT_GROUP_PREFIX_PREDICATE.format(var='b')}",
                 "RETURN count(r) AS relationship_count;",
             ]
         )
         records, _, _ = self.driver.execute_query(
-            query, parentGroupIdRegex=parent_group_id_regex
+            query,
+            {"parentGroupIdPrefix": parent_group_id.lower()},
+            database_=self.database,
+            routing_=RoutingControl.READ,
         )
         if not records:
             return 0
         else:
             return records[0]["relationship_count"]
 
-    def execute_query(self, cypher_query: str, **kwargs):
-        with self.driver.session() as session:
-            result = session.run(cypher_query, **kwargs)
-            data = [record.data() for record in result]
-        return data
+    def get_counts(self, parent_group_id: str) -> tuple[int, int]:
+        """Node and edge counts for a parent group, in a single round-trip"""
+        query = "\n ".join(
+            [
+                f"MATCH (n:{NODE_LABELS})",
+                f"WHERE {_PARENT_GROUP_PREFIX_PREDICATE.format(var='n')}",
+                "WITH count(n) AS node_count",
+                f"OPTIONAL MATCH (a:{NODE_LABELS})-[r]->(b:{NODE_LABELS})",
+                f"WHERE {_PARENT_GROUP_PREFIX_PREDICATE.format(var='a')}",
+                f"OR {_PARENT_GROUP_PREFIX_PREDICATE.format(var='b')}",
+                "RETURN node_count, count(r) AS relationship_count;",
+            ]
+        )
+        records, _, _ = self.driver.execute_query(
+            query,
+            {"parentGroupIdPrefix": parent_group_id.lower()},
+            database_=self.database,
+            routing_=RoutingControl.READ,
+        )
+        if not records:
+            return 0, 0
+        else:
+            return records[0]["node_count"], records[0]["relationship_count"]
+
+    def execute_query(
+        self,
+        cypher_query: str,
+        routing_: RoutingControl = RoutingControl.WRITE,
+        **kwargs,
+    ):
+        records, _, keys = self.driver.execute_query(
+            cypher_query, kwargs, database_=self.database, routing_=routing_
+        )
+        # Records are tuples, so zip them against the shared key list rather than
+        # calling record.data() per row. Graph values (nodes, lists) are left as-is;
+        # neo4j nodes already support key lookup and items().
+        return [dict(zip(keys, record, strict=True)) for record in records]
 
     async def delete_integration(self, integration_id: str):
-        cypher_query = """
-        MATCH (n) WHERE n.integration_id = $integration_id
+        """Delete the integration's nodes in batches, each in its own transaction, so
+        that large integrations don't build up one huge transaction.
+        """
+        cypher_query = f"""
+        MATCH (n:{NODE_LABELS}) WHERE n.integration_id = $integration_id
+        WITH n LIMIT $batch_size
         DETACH DELETE n
+        RETURN count(*) AS deleted
         """
-        async with self.async_driver.session() as session:
-            await session.run(cypher_query, integration_id=str(integration_id))
-        await asyncio.sleep(1)
+        while True:
+            records, _, _ = await self.async_driver.execute_query(
+                cypher_query,
+                {
+                    "integration_id": str(integration_id),
+                    "batch_size": DELETE_BATCH_SIZE,
+                },
+                database_=self.database,
+            )
+            if not records or records[0]["deleted"] == 0:
+                break
+
+    def backfill_id_lc(self) -> int:
+        """One-off migration: set `id_lc` on nodes written before it existed. Runs in
+        batches, each in its own transaction, and returns the number of nodes updated.
+        """
+        cypher_query = f"""
+        MATCH (n:{NODE_LABELS}) WHERE n.id_lc IS NULL AND n.id IS NOT NULL
+        WITH n LIMIT $batch_size
+        SET n.id_lc = toLower(n.id)
+        RETURN count(*) AS updated
+        """
+        total = 0
+        while True:
+            records, _, _ = self.driver.execute_query(
+                cypher_query,
+                {"batch_size": BACKFILL_BATCH_SIZE},
+                database_=self.database,
+            )
+            if not records or records[0]["updated"] == 0:
+                return total
+            total += records[0]["updated"]
 
     def get_nodes_from_url(self, url: str) -> list[Any]:
-        cypher_query = """
-        MATCH (n) WHERE n.url = $url
+        cypher_query = f"""
+        MATCH (n:{NODE_LABELS}) WHERE n.url = $url
         RETURN n.id as id
         """
-        return self.execute_query(cypher_query, url=url)
+        return self.execute_query(cypher_query, routing_=RoutingControl.READ, url=url)
+
+
+if __name__ == "__main__":
+    from app.db.container import Container
+
+    container = Container()
+    print(f"Backfilled `id_lc` on {container.graph_client().backfill_id_lc()} nodes")
@@ -1,10 +1,15 @@
 import asyncio
 import base64
 import logging
+import time
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
-from typing import Any
+from threading import Event, Lock, Thread
+from typing import Any, TypeVar, cast
 
-from kubernetes import client, config
+from cachetools import TTLCache
+from kubernetes import client, config, watch
 from kubernetes.client.exceptions import ApiException
 from pydantic import SecretStr
 
@@ -18,9 +23,188 @@ from app.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-# Kubernetes config
-config.incluster_config.load_incluster_config()
+# Connections kept open to the API server, so that concurrent requests (e.g., a batch of
+# job creations) don't queue behind each other or reconnect
+API_CONNECTION_POOL_MAXSIZE = 32
+
+
+@cache
+def _get_api_client() -> client.ApiClient:
+    """
+    One API client (and so one HTTP connection pool) for the whole process. Operators
+    are created per request, and every API object would otherwise build its own pool
+    and TLS sessions. The in-cluster config is loaded here, on first use, rather than
+    at import, so importing this module doesn't require a cluster.
+    """
+    config.incluster_config.load_incluster_config()
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = max(
+        configuration.connection_pool_maxsize, API_CONNECTION_POOL_MAXSIZE
+    )
+    return client.ApiClient(configuration=configuration)
+
+
+# Short-lived cache for existence checks, keyed by (kind, namespace, name). Objects
+# that don't exist are cached as `_MISSING`, so repeated probes for absent objects
+# don't hit the API server either. Cluster-scoped objects use an empty namespace. Only
+# used to skip creating objects that already exist; writes handle 409s themselves and
+# evict the entry.
+_LOOKUP_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_LOOKUP_CACHE_LOCK = Lock()
+_MISSING = object()
+
+# Label used to select the resources that belong to an integration's processors
+PART_OF_LABEL = "app.kubernetes.io/part-of"
+
+# Field manager recorded on objects we create or update via server-side apply
+FIELD_MANAGER = "cmd-a"
+
+# Let the garbage collector remove dependents (e.g., a job's pods) server-side, so
+# DELETE requests return right away instead of waiting on the cascade.
+BACKGROUND_DELETE_OPTIONS = client.V1DeleteOptions(propagation_policy="Background")
+
+
+# Settings don't change for the lifetime of the process, so dump them once
+_SETTINGS_DUMP: dict[str, Any] = Settings.model_dump()
+
+
+def _env_vars_from_settings() -> list[tuple[str, client.V1EnvVar]]:
+    """(setting name, environment variable) pairs for every non-empty setting."""
+    env_vars: list[tuple[str, client.V1EnvVar]] = []
+    for env_var, env_var_value in _SETTINGS_DUMP.items():
+        # Skip paths
+        if isinstance(env_var_value, Path):
+            continue
+
+        # Unnest nested environment variables. Assume only one level of nesting.
+        elif isinstance(env_var_value, dict):
+            for nested_env_var, nested_env_var_value in env_var_value.items():
+                if nested_env_var_value:
+                    env_vars.append(
+                        (
+                            env_var,
+                            client.V1EnvVar(
+                                name=f"{env_var}__{nested_env_var.upper()}",
+                                value=(
+                                    nested_env_var_value.get_secret_value()
+                                    if isinstance(nested_env_var_value, SecretStr)
+                                    else str(nested_env_var_value)
+                                ),
+                            ),
+                        )
+                    )
+        else:
+            if env_var_value:
+                env_vars.append(
+                    (
+                        env_var,
+                        client.V1EnvVar(
+                            name=env_var,
+                            value=(
+                                env_var_value.get_secret_value()
+                                if isinstance(env_var_value, SecretStr)
+                                else str(env_var_value)
+                            ),
+                        ),
+                    )
+                )
+    return env_vars
+
+
+_SETTINGS_ENV_VARS = _env_vars_from_settings()
+_FROZEN_ENV_VARS: list[client.V1EnvVar] = [v for _, v in _SETTINGS_ENV_VARS]
+
+
+class InformerCache:
+    """
+    Local copy of the objects returned by `list_fn` (e.g.,
+    `BatchV1Api.list_namespaced_job`), kept up to date by a single long-lived WATCH
+    running in a background thread. Reads are served from memory instead of listing
+    the collection on every call. Scope informers with a label selector to keep memory
+    bounded.
+    """
+
+    def __init__(
+        self, list_fn: Callable[..., Any], watch_timeout: int = 300, **list_kwargs
+    ):
+        self.list_fn = list_fn
+        self.watch_timeout = watch_timeout
+        self.list_kwargs = list_kwargs
+        self._items: dict[tuple[str, str], Any] = {}
+        self._lock = Lock()
+        self._synced = Event()
+        self._thread: Thread | None = None
+
+    @staticmethod
+    def _key(obj: Any) -> tuple[str, str]:
+        return (obj.metadata.namespace or "", obj.metadata.name)
+
+    def start(self) -> None:
+        """Start the informer, if it isn't already running."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        backoff = 1
+        while True:
+            try:
+                # Full LIST to (re)build the cache, then WATCH from its resource
+                # version. A 410 means our resource version is too old to resume from,
+                # so we start over with a fresh LIST.
+                resp = self.list_fn(**self.list_kwargs)
+                items = {self._key(obj): obj for obj in resp.items}
+                with self._lock:
+                    self._items = items
+                self._synced.set()
+                resource_version = resp.metadata.resource_version
+                backoff = 1
+                while True:
+                    w = watch.Watch()
+                    for event in w.stream(
+                        self.list_fn,
+                        resource_version=resource_version,
+                        timeout_seconds=self.watch_timeout,
+                        **self.list_kwargs,
+                    ):
+                        obj = event["object"]
+                        with self._lock:
+                            if event["type"] == "DELETED":
+                                self._items.pop(self._key(obj), None)
+                            else:
+                                self._items[self._key(obj)] = obj
+                    resource_version = w.resource_version or resource_version
+            except ApiException as e:
+                if e.status == 410:
+                    continue
+                logger.error(f"Informer for {self.list_fn.__name__} failed: {e}")
+            except Exception:
+                # Keep the informer alive through unexpected errors (e.g., dropped
+                # connections), but log the traceback
+                logger.exception(f"Informer for {self.list_fn.__name__} failed")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
+    def _wait_for_sync(self, timeout: float) -> None:
+        self.start()
+        if not self._synced.wait(timeout=timeout):
+            raise TimeoutError(f"Informer for {self.list_fn.__name__} did not sync!")
+
+    def list(self, timeout: float = 30) -> list[Any]:
+        """Objects currently in the cache. Blocks until the first LIST completes."""
+        self._wait_for_sync(timeout)
+        with self._lock:
+            return list(self._items.values())
+
+    def count(self, timeout: float = 30) -> int:
+        """Number of objects currently in the cache. Blocks until the first LIST
+        completes."""
+        self._wait_for_sync(timeout)
+        with self._lock:
+            return len(self._items)
 
 
 class KubernetesOperator:
@@ -35,10 +219,38 @@ class KubernetesOperator:
     rbac_authorization_api: client.RbacAuthorizationV1Api
 
     def __init__(self):
-        self.core_api = client.CoreV1Api()
-        self.apps_api = client.AppsV1Api()
-        self.batch_api = client.BatchV1Api()
-        self.rbac_authorization_api = client.RbacAuthorizationV1Api()
+        api_client = _get_api_client()
+        self.core_api = client.CoreV1Api(api_client)
+        self.apps_api = client.AppsV1Api(api_client)
+        self.batch_api = client.BatchV1Api(api_client)
+        self.rbac_authorization_api = client.RbacAuthorizationV1Api(api_client)
+        self._job_informers: dict[tuple[str, str], InformerCache] = {}
+
+    @staticmethod
+    def _cached_get(
+        kind: str, namespace: str, name: str, loader: Callable[[], Any]
+    ) -> Any | None:
+        """Return the object from `loader`, or None if it doesn't exist (404). Results,
+        including misses, are cached for a short time.
+        """
+        key = (kind, namespace, name)
+        with _LOOKUP_CACHE_LOCK:
+            cached = _LOOKUP_CACHE.get(key)
+        if cached is None:
+            try:
+                cached = loader()
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+                cached = _MISSING
+            with _LOOKUP_CACHE_LOCK:
+                _LOOKUP_CACHE[key] = cached
+        return None if cached is _MISSING else cached
+
+    @staticmethod
+    def _invalidate(kind: str, namespace: str, name: str) -> None:
+        with _LOOKUP_CACHE_LOCK:
+            _LOOKUP_CACHE.pop((kind, namespace, name), None)
 
     @staticmethod
     def create_integration_execution_role_name(
@@ -103,6 +315,20 @@ class KubernetesOperator:
             )
         return resp.metadata.name
 
+    @staticmethod
+    def create_processor_labels(integration_type: IntegrationType) -> dict[str, str]:
+        """
+        Labels attached to chunk processing jobs and their pods, so that they can be
+        selected server-side. Returns a dictionary with one key,
+        `app.kubernetes.io/part-of`, that maps to `<integration_type>-processor`.
+        """
+        return {PART_OF_LABEL: f"{integration_type}-processor"}
+
+    @staticmethod
+    def create_label_selector(labels: dict[str, str]) -> str:
+        """Label selector string (`k1=v1,k2=v2`) matching all inputted labels."""
+        return ",".join(f"{k}={v}" for k, v in labels.items())
+
     def create_deployment_label_selector(
         self,
         integration_type: IntegrationType,
@@ -124,76 +350,45 @@ class KubernetesOperator:
             )
         }
 
-    def list_namespaces(self) -> list[str]:
-        namespaces = self.core_api.list_namespace()
-        namespaces_list: list[str] = []
-        for ns in namespaces.items:
-            if ns.metadata and ns.metadata.name:
-                namespaces_list.append(ns.metadata.name)
-        return namespaces_list
-
     def create_namespace(self, namespace: str) -> client.V1Namespace:
         # If namespace exists, just return it.
-        namespaces: client.V1NamespaceList = self.core_api.list_namespace()
-        if namespaces.items:
-            for ns in namespaces.items:
-                # For mypy
-                if not isinstance(ns, client.V1Namespace):
-                    raise Exception("Unrecognized type in V1NamespaceList!")
-
-                namespace_name = self.get_name_from_metadata(ns)
-                if namespace_name == namespace:
-                    return ns
-
-        return self.core_api.create_namespace(
-            body=client.V1Namespace(
-                api_version="v1",
-                kind="Namespace",
-                metadata=client.V1ObjectMeta(name=namespace),
-            )
+        existing = self._cached_get(
+            "namespace",
+            "",
+            namespace,
+            lambda: self.core_api.read_namespace(name=namespace),
         )
+        if existing:
+            return existing
+
+        try:
+            return self.core_api.create_namespace(
+                body=client.V1Namespace(
+                    api_version="v1",
+                    kind="Namespace",
+                    metadata=client.V1ObjectMeta(name=namespace),
+                )
+            )
+        except ApiException as e:
+            # Created since the (cached) lookup
+            if e.status != 409:
+                raise
+            return self.core_api.read_namespace(name=namespace)
+        finally:
+            self._invalidate("namespace", "", namespace)
 
     @staticmethod
     def create_env_vars_from_settings(
         exclude: list[str] | None = None,
     ) -> list[client.V1EnvVar]:
-        env_var_list: list[client.V1EnvVar] = []
-        for env_var, env_var_value in Settings.model_dump().items():
-            # Skip variables to exclude
-            if exclude and env_var in exclude:
-                continue
-
-            # Skip paths
-            elif isinstance(env_var_value, Path):
-                continue
-
-            # Unnest nested environment variables. Assume only one level of nesting.
-            elif isinstance(env_var_value, dict):
-                for nested_env_var, nested_env_var_value in env_var_value.items():
-                    if nested_env_var_value:
-                        env_var_list.append(
-                            client.V1EnvVar(
-                                name=f"{env_var}__{nested_env_var.upper()}",
-                                value=(
-                                    nested_env_var_value.get_secret_value()
-                                    if isinstance(nested_env_var_value, SecretStr)
-                                    else str(nested_env_var_value)
-                                ),
-                            )
-                        )
-            else:
-                if env_var_value:
-                    env_var_list.append(
-                        client.V1EnvVar(
-                            name=env_var,
-                            value=(
-                                env_var_value.get_secret_value()
-                                if isinstance(env_var_value, SecretStr)
-                                else str(env_var_value)
-                            ),
-                        )
-                    )
-        return env_var_list
+        """
+        Environment variables for every setting. These are built once per process,
+        and the returned list is shared when nothing is excluded, so don't mutate it.
+        """
+        if not exclude:
+            return _FROZEN_ENV_VARS
+        exclude_set = set(exclude)
+        return [v for k, v in _SETTINGS_ENV_VARS if k not in exclude_set]
 
     def get_configmap_data(
         self,
@@ -214,17 +409,16 @@ class KubernetesOperator:
         """Copy ConfigMap from default namespace to a users' namespace. Used to
         propagate service names to the users' namespaces.
         """
-        target_configmaps: client.V1ConfigMapList = (
-            self.core_api.list_namespaced_config_map(namespace=target_namespace)
+        existing = self._cached_get(
+            "configmap",
+            target_namespace,
+            configmap_name,
+            lambda: self.core_api.read_namespaced_config_map(
+                name=configmap_name, namespace=target_namespace
+            ),
         )
-        if target_configmaps.items:
-            for target_configmap in target_configmaps.items:
-                # For mypy
-                if not isinstance(target_configmap, client.V1ConfigMap):
-                    raise Exception("Unrecognized type in V1ConfigMapList!")
-                target_configmap_name = self.get_name_from_metadata(target_configmap)
-                if target_configmap_name == configmap_name:
-                    return target_configmap
+        if existing:
+            return existing
 
         # If we've reached this stage, then the ConfigMap does not exist in the target
         # database.
@@ -240,10 +434,19 @@ class KubernetesOperator:
             data=configmap.data if configmap.data else {},
             binary_data=configmap.binary_data if configmap.binary_data else {},
         )
-        resp = self.core_api.create_namespaced_config_map(
-            namespace=target_namespace, body=new_configmap
-        )
-        return resp
+        try:
+            return self.core_api.create_namespaced_config_map(
+                namespace=target_namespace, body=new_configmap
+            )
+        except ApiException as e:
+            # Created since the (cached) lookup
+            if e.status != 409:
+                raise
+            return self.core_api.read_namespaced_config_map(
+                name=configmap_name, namespace=target_namespace
+            )
+        finally:
+            self._invalidate("configmap", target_namespace, configmap_name)
 
     def copy_secret(
         self, secret_name: str, target_namespace: str, source_namespace: str = "default"
@@ -251,17 +454,16 @@ class KubernetesOperator:
         """Copy Secret from default namespace to a users' namespace. Used to
         propagate service names to the users' namespaces.
         """
-        secret_list: client.V1SecretList = self.core_api.list_namespaced_secret(
-            namespace=target_namespace
+        existing = self._cached_get(
+            "secret",
+            target_namespace,
+            secret_name,
+            lambda: self.core_api.read_namespaced_secret(
+                name=secret_name, namespace=target_namespace
+            ),
         )
-        if secret_list.items:
-            for target_secret in secret_list.items:
-                # For mypy
-                if not isinstance(target_secret, client.V1Secret):
-                    raise Exception("Unrecognized type in V1SecretList!")
-                target_secret_name = self.get_name_from_metadata(target_secret)
-                if target_secret_name == secret_name:
-                    return target_secret
+        if existing:
+            return existing
 
         # If we've reached this stage, then the ConfigMap does not exist in the target
         # database.
@@ -278,36 +480,53 @@ class KubernetesOperator:
             string_data=secret.string_data if secret.string_data else {},
             type=secret.type,
         )
-        resp = self.core_api.create_namespaced_secret(
-            namespace=target_namespace, body=new_secret
+        try:
+            return self.core_api.create_namespaced_secret(
+                namespace=target_namespace, body=new_secret
+            )
+        except ApiException as e:
+            # Created since the (cached) lookup
+            if e.status != 409:
+                raise
+            return self.core_api.read_namespaced_secret(
+                name=secret_name, namespace=target_namespace
+            )
+        finally:
+            self._invalidate("secret", target_namespace, secret_name)
+
+    def apply(self, resource_path: str, manifest: Any, response_type: str) -> Any:
+        """
+        Server-side apply `manifest` at `resource_path` (e.g.,
+        `/api/v1/namespaces/<namespace>/serviceaccounts/<name>`). Creates the object or
+        updates the fields we manage in one request, without reading it first.
+        `manifest` must set `api_version` and `kind`.
+        """
+        return self.core_api.api_client.call_api(
+            resource_path,
+            "PATCH",
+            query_params=[("fieldManager", FIELD_MANAGER), ("force", "true")],
+            header_params={
+                "Accept": "application/json",
+                "Content-Type": "application/apply-patch+yaml",
+            },
+            body=manifest,
+            response_type=response_type,
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
         )
-        return resp
 
     def create_service_account(
         self, namespace: str, service_account_name: str
     ) -> client.V1ServiceAccount:
-        # See if service account already exists
-        service_accounts: client.V1ServiceAccountList = (
-            self.core_api.list_namespaced_service_account(namespace=namespace)
-        )
-        if service_accounts.items:
-            for svc_account in service_accounts.items:
-                # For mypy
-                if not isinstance(svc_account, client.V1ServiceAccount):
-                    raise Exception("Unrecognized type in V1ServiceAccountList!")
-
-                svc_account_name = self.get_name_from_metadata(svc_account)
-                if svc_account_name == service_account_name:
-                    return svc_account
-
-        # If we've reach this stage, then the service account does not exist
-        resp = self.core_api.create_namespaced_service_account(
-            namespace=namespace,
-            body=client.V1ServiceAccount(
-                metadata=client.V1ObjectMeta(name=service_account_name)
+        return self.apply(
+            f"/api/v1/namespaces/{namespace}/serviceaccounts/{service_account_name}",
+            client.V1ServiceAccount(
+                api_version="v1",
+                kind="ServiceAccount",
+                metadata=client.V1ObjectMeta(name=service_account_name),
             ),
+            "V1ServiceAccount",
         )
-        return resp
 
     def create_all_access_rbac_role(
         self,
@@ -333,29 +552,11 @@ class KubernetesOperator:
         verbs = ["*"] if not verbs else verbs
 
         new_role_name = "all-resources-all-actions"
-        existing_roles: client.V1RoleList = (
-            self.rbac_authorization_api.list_namespaced_role(namespace=namespace)
-        )
-
-        # If there are no cluster roles (which should never be the case), then ignore.
-        # Otherwise, iterate through the cluster role and see if
-        # `all-resources-all-actions` exists.
-        if existing_roles.items:
-            for role in existing_roles.items:
-                # For mypy
-                if not isinstance(role, client.V1Role):
-                    raise Exception("Unrecognized type in V1RoleList!")
-
-                # Return cluster role if it already exists
-                role_name = self.get_name_from_metadata(role)
-                if role_name == new_role_name:
-                    return role
-
-        # If we've reached this code, the cluster role does not exist.
-        resp: client.V1Role = self.rbac_authorization_api.create_namespaced_role(
-            namespace=namespace,
-            body=client.V1Role(
+        return self.apply(
+            f"/apis/rbac.authorization.k8s.io/v1/namespaces/{namespace}/roles/{new_role_name}",
+            client.V1Role(
                 api_version="rbac.authorization.k8s.io/v1",
+                kind="Role",
                 metadata=client.V1ObjectMeta(name=new_role_name),
                 rules=[
                     client.V1PolicyRule(
@@ -365,8 +566,8 @@ class KubernetesOperator:
                     )
                 ],
             ),
+            "V1Role",
         )
-        return resp
 
     def create_role_binding(
         self,
@@ -380,80 +581,106 @@ class KubernetesOperator:
         """
         role_binding_name = f"{role_name}-binding"
 
-        role_bindings = self.rbac_authorization_api.list_namespaced_role_binding(
-            namespace=namespace
-        )
-        if role_bindings.items:
-            # For mypy
-            for role_binding in role_bindings.items:
-                if not isinstance(role_binding, client.V1RoleBinding):
-                    raise Exception("Unrecognized type in V1RoleBindingList!")
-
-                # Role reference must match the inputted role name
-                if (
-                    self.get_name_from_metadata(role_binding) == role_binding_name
-                    and role_binding.role_ref
-                    and role_binding.role_ref.kind == "Role"
-                    and role_binding.role_ref.name == role_name
-                ):
-                    # We have to do these annoying ifs because the API client's return
-                    # type can be None, and mypy throws a fit if we don't have them...
-                    if role_binding.subjects:
-                        for subject in role_binding.subjects:
-                            # More stuff for mypy...
-                            if not isinstance(subject, client.RbacV1Subject):  # type: ignore
-                                raise Exception(
-                                    "Unrecognized subject type in V1RoleBinding!"
-                                )
-
-                            # If the current subject exists, then just return
-                            if (
-                                subject.kind
-                                and subject.kind == "ServiceAccount"
-                                and subject.name
-                                and subject.name == service_account_name
-                            ):
-                                return role_binding
-
-                        # Otherwise, add another subject to the binding
-                        new_subject = client.RbacV1Subject(  # type: ignore
+        # Whether we patch or create depends on the live object, so don't use the
+        # lookup cache here.
+        role_binding: client.V1RoleBinding | None
+        try:
+            role_binding = self.rbac_authorization_api.read_namespaced_role_binding(
+                name=role_binding_name, namespace=namespace
+            )
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            role_binding = None
+
+        # Role reference must match the inputted role name
+        if (
+            role_binding
+            and role_binding.role_ref
+            and role_binding.role_ref.kind == "Role"
+            and role_binding.role_ref.name == role_name
+        ):
+            # If the service account is already a subject, then just return
+            subjects = role_binding.subjects or []
+            if ("ServiceAccount", service_account_name) in {
+                (subject.kind, subject.name) for subject in subjects
+            }:
+                return role_binding
+
+            # Otherwise, add another subject to the binding
+            new_subject = client.RbacV1Subject(  # type: ignore
+                kind="ServiceAccount",
+                name=service_account_name,
+                api_group="",
+            )
+            try:
+                return self.rbac_authorization_api.patch_namespaced_role_binding(
+                    name=role_binding_name,
+                    namespace=namespace,
+                    body={"subjects": [*subjects, new_subject]},
+                )
+            except ApiException as e:
+                # Deleted since we read it; create it below
+                if e.status != 404:
+                    raise
+            finally:
+                self._invalidate("rolebinding", namespace, role_binding_name)
+
+        # If we've reach this stage, then no role binding exists
+        try:
+            return self.rbac_authorization_api.create_namespaced_role_binding(
+                namespace=namespace,
+                body=client.V1RoleBinding(
+                    metadata=client.V1ObjectMeta(name=role_binding_name),
+                    role_ref=client.V1RoleRef(
+                        kind="Role",
+                        name=role_name,
+                        api_group="rbac.authorization.k8s.io",
+                    ),
+                    subjects=[
+                        client.RbacV1Subject(  # type: ignore
                             kind="ServiceAccount",
                             name=service_account_name,
                             api_group="",
                         )
-                        resp = (
-                            self.rbac_authorization_api.patch_namespaced_role_binding(
-                                name=role_binding_name,
-                                namespace=namespace,
-                                body={
-                                    "subjects": role_binding.subjects + [new_subject]
-                                },
-                            )
-                        )
-                        return resp
-
-        # If we've reach this stage, then no role binding exists
-        resp = self.rbac_authorization_api.create_namespaced_role_binding(
-            namespace=namespace,
-            body=client.V1RoleBinding(
-                metadata=client.V1ObjectMeta(name=role_binding_name),
-                role_ref=client.V1RoleRef(
-                    kind="Role", name=role_name, api_group="rbac.authorization.k8s.io"
+                    ],
                 ),
-                subjects=[
-                    client.RbacV1Subject(  # type: ignore
-                        kind="ServiceAccount",
-                        name=service_account_name,
-                        api_group="",
-                    )
-                ],
-            ),
+            )
+        finally:
+            self._invalidate("rolebinding", namespace, role_binding_name)
+
+    async def provision_namespace(
+        self, namespace: str, service_account_name: str = "default"
+    ) -> None:
+        """
+        Create the namespace, then the service account, the "all access" role, and the
+        binding between them. The role and service account are server-side applied, and
+        the binding only references them by name, so the three are created concurrently
+        once the namespace exists.
+        """
+        await self._acall(self.create_namespace, namespace)
+        await asyncio.gather(
+            self._acall(self.create_service_account, namespace, service_account_name),
+            self._acall(self.create_all_access_rbac_role, namespace),
+            self._acall(self.create_role_binding, namespace, service_account_name),
         )
-        return resp
 
     def destroy_namespace(self, namespace: str) -> None:
-        # We don't need this deletion operation to be blocking...
-        self.core_api.delete_namespace(name=namespace, async_req=True)  # type: ignore
+        # Background propagation, so this doesn't block on the namespace's contents
+        # being cleaned up.
+        try:
+            self.core_api.delete_namespace(
+                name=namespace, body=BACKGROUND_DELETE_OPTIONS
+            )
+        except ApiException as e:
+            if e.status != 404:
+                raise
+
+        # Drop everything we've cached for the namespace
+        with _LOOKUP_CACHE_LOCK:
+            for key in [k for k in _LOOKUP_CACHE if k[1] == namespace]:
+                _LOOKUP_CACHE.pop(key, None)
+        self._invalidate("namespace", "", namespace)
         return None
 
     def destroy_deployment(
@@ -464,7 +691,7 @@ class KubernetesOperator:
                 name=deployment_name, namespace=namespace, **kwargs
             )
         except ApiException as e:
-            if "Not Found" not in str(e.reason):
+            if e.status != 404:
                 raise
         return None
 
@@ -474,7 +701,7 @@ class KubernetesOperator:
                 name=cronjob_name, namespace=namespace, **kwargs
             )
         except ApiException as e:
-            if "Not Found" not in str(e.reason):
+            if e.status != 404:
                 raise
         return None
 
@@ -484,15 +711,11 @@ class KubernetesOperator:
         secret_name: str,
         secret_data: dict[str, Any],
     ) -> client.V1Secret:
-        current_namespaced_secrets = self.core_api.list_namespaced_secret(
-            namespace=namespace
-        )
-        current_namespaced_secret_names = [
-            self.get_name_from_metadata(resource)
-            for resource in current_namespaced_secrets.items
-        ]
+        # Base64 output is always ASCII
         secret_data_encoded = {
-            k: base64.b64encode(v.encode("utf-8")).decode("utf-8")
+            k: base64.b64encode(v if isinstance(v, bytes) else v.encode()).decode(
+                "ascii"
+            )
             for k, v in secret_data.items()
         }
         body = client.V1Secret(
@@ -502,14 +725,20 @@ class KubernetesOperator:
             type="Opaque",
             data=secret_data_encoded,
         )
-        res = (
-            self.core_api.patch_namespaced_secret(
+        # Try to create the secret and patch it if it already exists, rather than
+        # deciding from a (possibly stale) cached lookup.
+        try:
+            return self.core_api.create_namespaced_secret(
+                namespace=namespace, body=body
+            )
+        except ApiException as e:
+            if e.status != 409:
+                raise
+            return self.core_api.patch_namespaced_secret(
                 name=secret_name, namespace=namespace, body=body
             )
-            if secret_name in current_namespaced_secret_names
-            else self.core_api.create_namespaced_secret(namespace=namespace, body=body)
-        )
-        return res
+        finally:
+            self._invalidate("secret", namespace, secret_name)
 
     def read_namespaced_secret(
         self, namespace: str, secret_name: str
@@ -521,94 +750,162 @@ class KubernetesOperator:
             raise ValueError(
                 f"Secret `{secret_name}` in {namespace} namespace does not have any data."
             )
-        return {
-            k: base64.b64decode(v.encode("utf-8")).decode("utf-8")
-            for k, v in secret.data.items()
-        }
+        # b64decode accepts the (ASCII) str directly
+        return {k: base64.b64decode(v).decode("utf-8") for k, v in secret.data.items()}
 
     def destroy_secret(
         self,
         namespace: str,
         secret_name: str,
     ) -> None:
-        self.core_api.delete_namespaced_secret(  # type: ignore
-            name=secret_name, namespace=namespace, async_req=True
-        )
+        try:
+            self.core_api.delete_namespaced_secret(
+                name=secret_name, namespace=namespace, body=BACKGROUND_DELETE_OPTIONS
+            )
+        except ApiException as e:
+            if e.status != 404:
+                raise
+        self._invalidate("secret", namespace, secret_name)
 
-    def async_delete_jobs(self, namespace: str, pattern: str) -> None:
-        jobs: client.V1JobList = self.batch_api.list_namespaced_job(namespace=namespace)
-        if jobs.items:
-            for job in jobs.items:
-                # For mypy
-                if not isinstance(job, client.V1Job):
-                    raise Exception("Unrecognized type in V1JobList!")
-
-                job_name = self.get_name_from_metadata(job)
-                if pattern in job_name:
-                    try:
-                        self.batch_api.delete_namespaced_job(  # type: ignore
-                            name=job_name, namespace=namespace, async_req=True
-                        )
-                    except ApiException as e:
-                        if "Not Found" not in str(e.reason):
-                            continue
+    @staticmethod
+    def _check_selectors(label_selector: str | None, field_selector: str | None):
+        # Never fall back to "everything in the namespace"
+        if not label_selector and not field_selector:
+            raise ValueError("Either `label_selector` or `field_selector` is required!")
+
+    # The API server deletes every matching object in one request, so there's no need
+    # to list and then delete objects one by one.
+    def async_delete_jobs(
+        self,
+        namespace: str,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        legacy_name_prefix: str | None = None,
+    ) -> None:
+        """
+        Delete the matching jobs. If `legacy_name_prefix` is set, also delete jobs
+        without a `PART_OF_LABEL` whose names start with it (i.e., jobs created before
+        processor jobs were labeled).
+        """
+        self._check_selectors(label_selector, field_selector)
+        self.batch_api.delete_collection_namespaced_job(
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            body=BACKGROUND_DELETE_OPTIONS,
+        )
+        if legacy_name_prefix:
+            self._delete_unlabeled(
+                self.batch_api.list_namespaced_job,
+                self.batch_api.delete_namespaced_job,
+                namespace,
+                legacy_name_prefix,
+            )
 
-    def async_delete_cron_jobs(self, namespace: str, pattern: str) -> None:
-        cron_jobs: client.V1CronJobList = self.batch_api.list_namespaced_cron_job(
-            namespace=namespace
+    def async_delete_cron_jobs(
+        self,
+        namespace: str,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> None:
+        self._check_selectors(label_selector, field_selector)
+        self.batch_api.delete_collection_namespaced_cron_job(
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            body=BACKGROUND_DELETE_OPTIONS,
         )
-        if cron_jobs.items:
-            for cron_job in cron_jobs.items:
-                # For mypy
-                if not isinstance(cron_job, client.V1CronJob):
-                    raise Exception("Unrecognized type in V1CronJobList!")
-
-                cron_job_name = self.get_name_from_metadata(cron_job)
-                if pattern in cron_job_name:
-                    try:
-                        self.batch_api.delete_namespaced_cron_job(  # type: ignore
-                            name=cron_job_name, namespace=namespace, async_req=True
-                        )
-                    except ApiException as e:
-                        if "Not Found" not in str(e.reason):
-                            continue
-
-    def async_delete_pods(self, namespace: str, pattern: str) -> None:
-        pods: client.V1PodList = self.core_api.list_namespaced_pod(namespace=namespace)
-        if pods.items:
-            for pod in pods.items:
-                # For mypy
-                if not isinstance(pod, client.V1Pod):
-                    raise Exception("Unrecognized type in V1PodList!")
-
-                pod_name = self.get_name_from_metadata(pod)
-                if pattern in pod_name:
-                    try:
-                        self.core_api.delete_namespaced_pod(  # type: ignore
-                            name=pod_name, namespace=namespace, async_req=True
-                        )
-                    except ApiException as e:
-                        if "Not Found" not in str(e.reason):
-                            continue
 
-    def get_jobs_matching_pattern(
+    def async_delete_pods(
         self,
         namespace: str,
-        pattern: str,
-    ) -> dict[str, client.V1Job]:
-        """Get namespaced jobs whose name matches the inputted pattern."""
-        matching_job_name_map: dict[str, client.V1Job] = {}
-        jobs: client.V1JobList = self.batch_api.list_namespaced_job(namespace=namespace)
-        if jobs.items:
-            for job in jobs.items:
-                # For mypy
-                if not isinstance(job, client.V1Job):
-                    raise Exception("Unrecognized type in V1JobList!")
-
-                job_name = self.get_name_from_metadata(job)
-                if pattern in job_name:
-                    matching_job_name_map[job_name] = job
-        return matching_job_name_map
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        legacy_name_prefix: str | None = None,
+    ) -> None:
+        """
+        Delete the matching pods. If `legacy_name_prefix` is set, also delete pods
+        without a `PART_OF_LABEL` whose names start with it.
+        """
+        self._check_selectors(label_selector, field_selector)
+        self.core_api.delete_collection_namespaced_pod(
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            body=BACKGROUND_DELETE_OPTIONS,
+        )
+        if legacy_name_prefix:
+            self._delete_unlabeled(
+                self.core_api.list_namespaced_pod,
+                self.core_api.delete_namespaced_pod,
+                namespace,
+                legacy_name_prefix,
+            )
+
+    @staticmethod
+    def _delete_unlabeled(
+        list_fn: Callable[..., Any],
+        delete_fn: Callable[..., Any],
+        namespace: str,
+        name_prefix: str,
+    ) -> None:
+        """
+        Delete the objects without a `PART_OF_LABEL` whose names start with
+        `name_prefix`. These can't be selected by label, so they're deleted one by one.
+        """
+        resp = list_fn(namespace=namespace, label_selector=f"!{PART_OF_LABEL}")
+        for obj in resp.items:
+            if not obj.metadata.name.startswith(name_prefix):
+                continue
+            try:
+                delete_fn(
+                    name=obj.metadata.name,
+                    namespace=namespace,
+                    body=BACKGROUND_DELETE_OPTIONS,
+                )
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+
+    def count_jobs_matching_selector(self, namespace: str, label_selector: str) -> int:
+        """
+        Count the namespaced jobs that match the inputted label selector. This is polled
+        by long-running workers, so it's served from an informer that is started on
+        first use.
+        """
+        return self._job_informer(namespace, label_selector).count()
+
+    def count_processor_jobs(
+        self, namespace: str, integration_type: IntegrationType
+    ) -> int:
+        """
+        Count the integration's chunk processing jobs. Jobs launched before processing
+        jobs were labeled don't match the label selector, so those are matched on their
+        name prefix instead.
+        """
+        num_jobs = self.count_jobs_matching_selector(
+            namespace,
+            self.create_label_selector(self.create_processor_labels(integration_type)),
+        )
+        # The informer only ever holds V1Jobs, and the API server always sets names
+        unlabeled_jobs = cast(
+            list[client.V1Job],
+            self._job_informer(namespace, f"!{PART_OF_LABEL}").list(),
+        )
+        prefix = f"{integration_type}-processor-"
+        return num_jobs + sum(
+            1 for job in unlabeled_jobs if job.metadata.name.startswith(prefix)
+        )
+
+    def _job_informer(self, namespace: str, label_selector: str) -> InformerCache:
+        key = (namespace, label_selector)
+        if key not in self._job_informers:
+            self._job_informers[key] = InformerCache(
+                self.batch_api.list_namespaced_job,
+                namespace=namespace,
+                label_selector=label_selector,
+            )
+        return self._job_informers[key]
 
     def check_job_status(
         self,
@@ -656,11 +953,42 @@ class KubernetesOperator:
         except ApiException as e:
             # If the job isn't found, then it succeeded and was deleted. We only delete
             # successful jobs, not failed jobs.
-            if "Not Found" in str(e):
+            if e.status == 404:
                 return IntegrationStatus.SUCCESS
             else:
                 raise
 
+    def _watch_deployment_replicas(
+        self, name: str, namespace: str, expected_replicas: int, timeout: int
+    ) -> bool:
+        # The first event reflects the deployment's current state, and we get another
+        # on every status change, so there's no need to poll.
+        w = watch.Watch()
+        for event in w.stream(
+            self.apps_api.list_namespaced_deployment,
+            namespace=namespace,
+            field_selector=f"metadata.name={name}",
+            timeout_seconds=timeout,
+        ):
+            deployment: client.V1Deployment = event["object"]
+            ready_replicas = 0
+            if deployment.status and deployment.status.ready_replicas is not None:
+                ready_replicas = deployment.status.ready_replicas
+
+            if ready_replicas == expected_replicas:
+                w.stop()
+                logger.info(f"Deployment {name} has {expected_replicas} ready replicas")
+                return True
+
+            logger.info(
+                f"Waiting for {name} replicas to be ready. "
+                f"Current: {ready_replicas}, "
+                f"Expected: {expected_replicas}"
+            )
+
+        logger.error(f"Timeout waiting for {name} replicas to be ready")
+        return False
+
     async def verify_deployment(
         self, name: str, namespace: str, expected_replicas: int, timeout: int = 300
     ) -> bool:
@@ -668,45 +996,42 @@ class KubernetesOperator:
         Verify that Deployment has the correct number of ready replicas
         """
         try:
-            start_time = asyncio.get_event_loop().time()
-            while True:
-                try:
-                    deployment: client.V1Deployment = (
-                        self.apps_api.read_namespaced_deployment_status(
-                            name=name, namespace=namespace
-                        )
-                    )
-                    if (
-                        deployment.status
-                        and deployment.status.ready_replicas == expected_replicas
-                    ):
-                        logger.info(
-                            f"Deployment {name} has {expected_replicas} ready replicas"
-                        )
-                        return True
+            return await asyncio.to_thread(
+                self._watch_deployment_replicas,
+                name,
+                namespace,
+                expected_replicas,
+                timeout,
+            )
+        except Exception as e:
+            logger.error(f"Error verifying deployment {name}: {str(e)}")
+            return False
 
-                    # For mypy
-                    ready_replicas = 0
-                    if (
-                        deployment.status
-                        and deployment.status.ready_replicas is not None
-                    ):
-                        ready_replicas = deployment.status.ready_replicas
+    # Async variants. The Kubernetes client is blocking, so these run the underlying
+    # call in a worker thread. Use these from coroutines (e.g., async request handlers)
+    # so that the event loop isn't blocked, and so that independent calls can be
+    # gathered.
+    @staticmethod
+    async def _acall(fn: Callable[..., T], *args, **kwargs) -> T:
+        return await asyncio.to_thread(fn, *args, **kwargs)
 
-                    logger.info(
-                        f"Waiting for {name} replicas to be ready. "
-                        f"Current: {ready_replicas}, "
-                        f"Expected: {expected_replicas}"
-                    )
+    async def adestroy_namespace(self, namespace: str) -> None:
+        return await self._acall(self.destroy_namespace, namespace)
 
-                except ApiException:
-                    pass
+    async def acreate_or_update_secret(
+        self,
+        namespace: str,
+        secret_name: str,
+        secret_data: dict[str, Any],
+    ) -> client.V1Secret:
+        return await self._acall(
+            self.create_or_update_secret, namespace, secret_name, secret_data
+        )
 
-                if asyncio.get_event_loop().time() - start_time > timeout:
-                    logger.error(f"Timeout waiting for {name} replicas to be ready")
-                    return False
+    async def aread_namespaced_secret(
+        self, namespace: str, secret_name: str
+    ) -> dict[str, Any]:
+        return await self._acall(self.read_namespaced_secret, namespace, secret_name)
 
-                await asyncio.sleep(5)
-        except Exception as e:
-            logger.error(f"Error verifying deployment {name}: {str(e)}")
-            return False
+    async def adestroy_secret(self, namespace: str, secret_name: str) -> None:
+        return await self._acall(self.destroy_secret, namespace, secret_name)
@@ -1,12 +1,10 @@
-import json
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any
-from urllib.parse import urlencode
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
-from pymongo import MongoClient
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, DESCENDING, MongoClient
 from pymongo.collection import Collection
 from pymongo.server_api import ServerApi
 
@@ -15,6 +13,12 @@ from app.db.models.choices import ChatRole
 # Logger
 logger = logging.getLogger(__name__)
 
+# Number of documents sent per insert_many call
+INSERT_BATCH_SIZE = 100
+
+# Number of documents fetched per cursor round trip
+CURSOR_BATCH_SIZE = 500
+
 
 class Citation(BaseModel):
     citation_number: int
@@ -27,15 +31,9 @@ class Message(BaseModel):
     role: ChatRole
     content: str
     context: str = Field(default="")
-    ts: str
+    ts: float
     citations: list[Citation] = Field(default_factory=list)
 
-    @model_validator(mode="after")
-    def convert_uuids_to_strings(self) -> "Message":
-        self.user_id = str(self.user_id)
-        self.chat_id = str(self.chat_id)
-        return self
-
 
 class Chat(BaseModel):
     user_id: UUID | str
@@ -43,13 +41,7 @@ class Chat(BaseModel):
     chat_id: UUID | str
     title: str
     query: str
-    ts: str
-
-    @model_validator(mode="after")
-    def convert_uuids_to_strings(self) -> "Chat":
-        self.user_id = str(self.user_id)
-        self.chat_id = str(self.chat_id)
-        return self
+    ts: float
 
 
 class DocumentStoreClient:
@@ -58,32 +50,7 @@ class DocumentStoreClient:
     context_collection: Collection
     messages_collection: Collection
 
-    def __init__(
-        self,
-        mongodb_driver: str,
-        mongodb_user: str,
-        mongodb_password: str,
-        mongodb_host: str,
-        mongodb_port: str | None,
-        mongodb_options: str | None = None,
-    ):
-        full_host = mongodb_host
-        if mongodb_port is not None:
-            full_host += f":{mongodb_port}"
-
-        connection_uri_template = "{driver}://{mongodb_user}:{mongodb_password}@{mongodb_host}{mongodb_port}/{mongodb_options}"
-        connection_uri = connection_uri_template.format(
-            driver=mongodb_driver,
-            mongodb_user=mongodb_user,
-            mongodb_password=mongodb_password,
-            mongodb_host=mongodb_host,
-            mongodb_port=mongodb_port if mongodb_port is not None else "",
-            mongodb_options=(
-                ("?" + urlencode(json.loads(mongodb_options)))
-                if mongodb_options is not None
-                else ""
-            ),
-        )
+    def __init__(self, connection_uri: str):
         self.client = MongoClient(
             connection_uri, server_api=ServerApi(version="1", strict=True)
         )
@@ -94,6 +61,41 @@ class DocumentStoreClient:
         self.context_collection = self.db["context"]
         self.messages_collection = self.db["messages"]
 
+        # Indexes
+        self.messages_collection.create_index(
+            [("user_id", ASCENDING), ("chat_id", ASCENDING), ("ts", ASCENDING)]
+        )
+        self.chats_collection.create_index([("user_id", ASCENDING), ("ts", DESCENDING)])
+        self.chats_collection.create_index([("chat_id", ASCENDING)], unique=True)
+
+    def migrate_string_timestamps(self) -> int:
+        """One-off migration: convert `ts` values stored as strings (before `ts` became
+        a float) to numbers. Mongo sorts numbers before strings and `$gte` only matches
+        values of the same type, so old chats would otherwise drop out of the chat list.
+        Strings that aren't numbers are left as they are. Returns the number of updated
+        documents.
+        """
+        updated = 0
+        for collection in (self.chats_collection, self.messages_collection):
+            res = collection.update_many(
+                {"ts": {"$type": "string"}},
+                [
+                    {
+                        "$set": {
+                            "ts": {
+                                "$convert": {
+                                    "input": "$ts",
+                                    "to": "double",
+                                    "onError": "$ts",
+                                }
+                            }
+                        }
+                    }
+                ],
+            )
+            updated += res.modified_count
+        return updated
+
     def delete_chat(
         self,
         user_id: UUID,
@@ -120,31 +122,39 @@ class DocumentStoreClient:
         user_id: UUID,
         chat_id: UUID,
     ) -> list[dict[str, Any]]:
-        cursor = self.messages_collection.find(
-            {"user_id": str(user_id), "chat_id": str(chat_id)},
-            projection={"_id": False},
-        ).sort({"ts": 1})
-        return [mes for mes in cursor]
+        cursor = (
+            self.messages_collection.find(
+                {"user_id": str(user_id), "chat_id": str(chat_id)},
+                projection={"_id": False},
+            )
+            .sort("ts", ASCENDING)
+            .batch_size(CURSOR_BATCH_SIZE)
+        )
+        return list(cursor)
 
     def add_messages_to_chat(self, messages: list[dict[str, Any]]):
-        # For validation...we only insert a couple messages at a time, so this shouldn't
-        # take too long (hopefully).
-        self.messages_collection.insert_many(messages)
+        # Unordered inserts let the server apply each batch in parallel and don't stop
+        # at the first failed document.
+        for i in range(0, len(messages), INSERT_BATCH_SIZE):
+            self.messages_collection.insert_many(
+                messages[i : i + INSERT_BATCH_SIZE], ordered=False
+            )
 
     def add_chat(self, chat: Chat):
-        self.chats_collection.insert_one(chat.model_dump())
+        # JSON mode stores the UUIDs as strings
+        self.chats_collection.insert_one(chat.model_dump(mode="json"))
 
     def add_context(self, context: dict[str, str]):
         self.context_collection.insert_one(context)
 
     def get_chat(self, chat_id: UUID) -> Chat:
-        chats = self.chats_collection.find(
+        chat_dict = self.chats_collection.find_one(
             {"chat_id": str(chat_id)}, projection={"_id": False}
         )
-        chat_objects = [Chat(**chat_dict) for chat_dict in chats]
-        if not chat_objects:
+        if chat_dict is None:
             raise Exception(f"Chat with ID {chat_id} not found!")
-        return chat_objects[0]
+        # Documents were validated by `Chat` before they were stored
+        return Chat.model_construct(**chat_dict)
 
     def get_chats_for_user(
         self, user_id: UUID, days: int | None
@@ -153,15 +163,27 @@ class DocumentStoreClient:
             "user_id": str(user_id),
         }
         if days is not None:
-            ts_lower_bound = str(
-                (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
-            )
+            # `ts` is stored as a number, so this is a numeric range on the index
+            ts_lower_bound = (
+                datetime.now(timezone.utc) - timedelta(days=days)
+            ).timestamp()
             query["ts"] = {"$gte": ts_lower_bound}
-        cursor = self.chats_collection.find(query, projection={"_id": False}).sort(
-            {"ts": -1}
+        cursor = (
+            self.chats_collection.find(query, projection={"_id": False})
+            .sort("ts", DESCENDING)
+            .batch_size(CURSOR_BATCH_SIZE)
         )
-        return [convo for convo in cursor]
+        return list(cursor)
 
     @staticmethod
     def add_context_to_message(message: str, context: str) -> str:
         return message + "\n" + context if context else message
+
+
+if __name__ == "__main__":
+    from app.db.container import Container
+
+    container = Container()
+    print(
+        f"Migrated `ts` on {container.mongodb().migrate_string_timestamps()} documents"
+    )
@@ -1,9 +1,19 @@
-import json
 from typing import Any
 from uuid import UUID
 
+import orjson
 from pydantic import BaseModel, Field, model_validator
-from redis import StrictRedis
+from redis import ConnectionPool, StrictRedis
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool
+from redis.asyncio import StrictRedis as AsyncStrictRedis
+from redis.client import Pipeline
+
+# Connection pool
+MAX_CONNECTIONS = 64
+HEALTH_CHECK_INTERVAL = 30  # seconds
+
+# Number of list items fetched per LRANGE call
+LRANGE_BATCH_SIZE = 1000
 
 
 class RedisClient(BaseModel):
@@ -14,6 +24,8 @@ class RedisClient(BaseModel):
     expiration: int
 
     _client: StrictRedis
+    _bytes_client: StrictRedis
+    _async_client: AsyncStrictRedis
 
     @model_validator(mode="after")
     def create_client(self) -> "RedisClient":
@@ -22,21 +34,56 @@ class RedisClient(BaseModel):
             "port": self.redis_port,
             "db": self.redis_db,
             "decode_responses": True,
+            "max_connections": MAX_CONNECTIONS,
+            "socket_keepalive": True,
+            "health_check_interval": HEALTH_CHECK_INTERVAL,
         }
         if self.redis_password:
             kwargs["password"] = self.redis_password
-        self._client = StrictRedis(**kwargs)  # type: ignore
+        pool = ConnectionPool(**kwargs)  # type: ignore
+        self._client = StrictRedis(connection_pool=pool)
+
+        # orjson parses UTF-8 bytes directly, so read chat history without decoding it
+        # to `str` first.
+        kwargs["decode_responses"] = False
+        bytes_pool = ConnectionPool(**kwargs)  # type: ignore
+        self._bytes_client = StrictRedis(connection_pool=bytes_pool)
+
+        # Blocking pops hold their connection for the whole timeout, so they get their
+        # own async pool. A queue has a single consumer per process, so one connection
+        # is enough; extra callers wait for it instead of opening more.
+        kwargs["decode_responses"] = True
+        kwargs["max_connections"] = 1
+        async_pool = AsyncBlockingConnectionPool(**kwargs)  # type: ignore
+        self._async_client = AsyncStrictRedis(connection_pool=async_pool)
         return self
 
     def add_messages_to_redis(
         self, chat_id: str | UUID, messages: list[dict[str, Any]]
     ):
-        self._client.rpush(str(chat_id), *[json.dumps(m) for m in messages])
-        self._client.expire(str(chat_id), self.expiration)
+        payloads = [orjson.dumps(m) for m in messages]
+        with self.pipeline() as pipe:
+            pipe.rpush(str(chat_id), *payloads)
+            pipe.expire(str(chat_id), self.expiration)
+            pipe.execute()
 
     def retrieve_messages_from_redis(self, chat_id: str | UUID) -> list[dict[str, Any]]:
-        messages = self._client.lrange(str(chat_id), 0, -1)
-        return [json.loads(m) for m in messages]
+        # Read long histories in slabs, so that Redis doesn't have to build one huge
+        # reply.
+        messages: list[dict[str, Any]] = []
+        start = 0
+        while True:
+            raw = self._bytes_client.lrange(
+                str(chat_id), start, start + LRANGE_BATCH_SIZE - 1
+            )
+            messages.extend(orjson.loads(m) for m in raw)
+            if len(raw) < LRANGE_BATCH_SIZE:
+                return messages
+            start += LRANGE_BATCH_SIZE
+
+    def pipeline(self, transaction: bool = False) -> Pipeline:
+        """Batch several commands into a single round trip."""
+        return self._client.pipeline(transaction=transaction)
 
     def simple_get(self, key: str) -> Any:
         return self._client.get(key)
@@ -44,8 +91,15 @@ class RedisClient(BaseModel):
     def simple_lpush(self, *args, **kwargs):
         return self._client.lpush(*args, **kwargs)
 
+    def simple_rpush(self, *args, **kwargs):
+        return self._client.rpush(*args, **kwargs)
+
     def simple_set(self, *args, **kwargs):
         return self._client.set(*args, **kwargs)
 
     def simple_brpop(self, *args, **kwargs):
         return self._client.brpop(*args, **kwargs)
+
+    async def async_brpop(self, *args, **kwargs):
+        """BRPOP that waits for an item without blocking the event loop."""
+        return await self._async_client.brpop(*args, **kwargs)
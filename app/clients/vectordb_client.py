@@ -1,6 +1,15 @@
 import asyncio
 import json
 import logging
+import multiprocessing
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Any
 
@@ -19,13 +28,15 @@ from app.processors.constants import SUPPORTED_INPUT_FORMATS
 from app.settings import Settings
 
 # Logging
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
 # Constants
 EMBED_MODEL_ID = "sentence-transformers/all-MiniLM-L6-v2"
-UPSERT_BATCH_SIZE = 200
+UPSERT_BATCH_SIZE = 100
+UPSERT_POOL_THREADS = 30  # concurrent upsert requests
+EMBED_WORKERS = 4  # documents embedded concurrently
+EMBED_BATCH_SIZE = 96  # max inputs per Pinecone inference request
 
 
 # Database — we don't use the Singleton here, because this channel processor is run
@@ -34,6 +45,49 @@ UPSERT_BATCH_SIZE = 200
 db = Database(db_url=Settings.get_db_uri())
 
 
+@cache
+def _get_converter() -> Any:
+    # Place imports in a function, since they are pretty expensive.
+    from docling.document_converter import DocumentConverter  # type: ignore
+
+    # From the docs:
+    #   For each document format, the document converter knows which format-specific
+    #   backend to employ for parsing the document and which pipeline to use for
+    #   orchestrating the execution, along with any relevant options.
+    # We'll start with the standard / simple pipelines for each of the allowed
+    # formats
+    return DocumentConverter(
+        allowed_formats=SUPPORTED_INPUT_FORMATS,
+    )
+
+
+@cache
+def _get_chunker() -> Any:
+    from docling.chunking import HybridChunker  # type: ignore
+    from transformers import AutoTokenizer  # type: ignore
+
+    tokenizer = AutoTokenizer.from_pretrained(EMBED_MODEL_ID)
+    return HybridChunker(tokenizer=tokenizer)
+
+
+@cache
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Pool used to convert documents. The pool (and its workers) lives as long as this
+    process, so each worker only loads the converter and tokenizer once. Use `spawn`,
+    since forking a process that already runs Pinecone's thread pool is not safe."""
+    return ProcessPoolExecutor(
+        max_workers=Settings.MAX_CONVERSION_PROCESSES,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _convert_document(path: Path) -> list[str]:
+    """Convert a document with Docling and split it into text chunks with Docling's
+    HybridChunker. Runs in a worker process."""
+    res = _get_converter().convert(path)
+    return [chunk.text for chunk in _get_chunker().chunk(dl_doc=res.document)]
+
+
 class VectorMetadata(BaseModel):
     id: str
     source: IntegrationType
@@ -50,50 +104,86 @@ class VectorDb(KubernetesOperator):
 
     pc: Pinecone
     async_pc: PineconeAsyncio
-    index: PineconeIndex
-    async_index: PineconeIndexAsyncio
 
     def __init__(self, pc: Pinecone, async_pc: PineconeAsyncio):
         super().__init__()
         self.pc = pc
         self.async_pc = async_pc
-        self.index = self.pc.Index(host=Settings.PINECONE.INDEX_HOST)
-        self.async_index = self.async_pc.IndexAsyncio(host=Settings.PINECONE.INDEX_HOST)
+
+    # The index clients are created on first use. Processor jobs only use the sync
+    # index, and the API server mostly uses the async one.
+    @cached_property
+    def index(self) -> PineconeIndex:
+        return self.pc.Index(
+            host=Settings.PINECONE.INDEX_HOST, pool_threads=UPSERT_POOL_THREADS
+        )
+
+    @cached_property
+    def async_index(self) -> PineconeIndexAsyncio:
+        return self.async_pc.IndexAsyncio(host=Settings.PINECONE.INDEX_HOST)
 
     def upsert_chunk_vectors(
         self, chunks: list[str], metadata: dict[str, Any], parent_group_id: str
     ) -> list[Vector]:
         vectors: list[Vector] = []
-        for idx, chunk in enumerate(chunks):
+
+        # Embed the chunks in as few requests as possible
+        embeddings_data: list[Any] = []
+        for start in range(0, len(chunks), EMBED_BATCH_SIZE):
             embeddings = self.pc.inference.embed(
                 model=Settings.PINECONE.INDEX_MODEL,
-                inputs=[chunk],
+                inputs=chunks[start : start + EMBED_BATCH_SIZE],
                 parameters={"input_type": "passage", "truncate": "END"},
             )
+            embeddings_data.extend(embeddings.data)
+
+        upserted_vectors: list[UpsertedVector] = []
+        for idx, embedding in enumerate(embeddings_data):
+            vector_id = f"{metadata["id"]}-chunk{idx}"
             vectors.append(
                 Vector(
-                    id=f"{metadata["id"]}-chunk{idx}",
-                    values=embeddings.data[0]["values"],
+                    id=vector_id,
+                    values=embedding["values"],
                     metadata=metadata,
                 )
             )
-
-            # Try adding the upserted vector to our database. Note that if it
-            # already exists (`vector_id` already exists), this will fail.
-            try:
-                db.add(
-                    db_object=UpsertedVector(
-                        vector_id=f"{metadata["id"]}-chunk{idx}",
-                        parent_group_id=str(parent_group_id),
-                    )
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to add vector to database with error {e}. Skipping..."
+            upserted_vectors.append(
+                UpsertedVector(
+                    vector_id=vector_id,
+                    parent_group_id=str(parent_group_id),
                 )
-                pass
+            )
+
+        # Record the upserted vectors in our database. Vectors that already exist
+        # (`vector_id` already exists) are skipped by the database via
+        # `ON CONFLICT (vector_id) DO NOTHING`.
+        try:
+            db.add_many(
+                upserted_vectors, ignore_conflicts=True, conflict_cols=["vector_id"]
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to add vectors to database with error {e}. Skipping..."
+            )
         return vectors
 
+    def upsert_vectors_async(self, namespace: str, vectors: list[Vector]) -> list[Any]:
+        """Send one upsert request per batch without waiting for the responses. Call
+        `.get()` on each of the returned results to wait for (and raise) them."""
+        return [
+            self.index.upsert(
+                vectors=vectors[start : start + UPSERT_BATCH_SIZE],
+                namespace=namespace,
+                async_req=True,
+            )
+            for start in range(0, len(vectors), UPSERT_BATCH_SIZE)
+        ]
+
+    def upsert_vectors(self, namespace: str, vectors: list[Vector]):
+        """Upsert all batches concurrently and wait for them to finish."""
+        for result in self.upsert_vectors_async(namespace, vectors):
+            result.get()
+
     def process_text(
         self, namespace: str, text: str, metadata: dict[str, Any], parent_group_id: str
     ):
@@ -105,11 +195,7 @@ class VectorDb(KubernetesOperator):
         )
         chunks = splitter.split_text(text)
         vectors = self.upsert_chunk_vectors(chunks, metadata, parent_group_id)
-        self.index.upsert(
-            vectors,
-            namespace=namespace,
-            batch_size=UPSERT_BATCH_SIZE,
-        )
+        self.upsert_vectors(namespace, vectors)
 
     def process_markdown_text(
         self,
@@ -131,11 +217,7 @@ class VectorDb(KubernetesOperator):
         else:
             nodes_txt = [node.get_content() for node in nodes]
             vectors = self.upsert_chunk_vectors(nodes_txt, metadata, parent_group_id)
-            self.index.upsert(
-                vectors,
-                namespace=namespace,
-                batch_size=UPSERT_BATCH_SIZE,
-            )
+            self.upsert_vectors(namespace, vectors)
 
     def process_documents(
         self,
@@ -145,61 +227,76 @@ class VectorDb(KubernetesOperator):
         parent_group_id: str,
     ):
         """Process all documents using Docling. Then, pass each document to Docling's
-        HybridChunker for computing embeddings.
+        HybridChunker for computing embeddings. The work is pipelined across documents:
+        documents are converted in a pool of worker processes, embedded in a pool of
+        threads as soon as their conversion finishes, and upserted in the background as
+        soon as their embeddings are ready.
         """
-        # Place imports in a function, since they are pretty expensive.
-        from docling.chunking import HybridChunker  # type: ignore
-        from docling.document_converter import DocumentConverter  # type: ignore
         from docling.exceptions import ConversionError  # type: ignore
-        from transformers import AutoTokenizer  # type: ignore
-
-        # From the docs:
-        #   For each document format, the document converter knows which format-specific
-        #   backend to employ for parsing the document and which pipeline to use for
-        #   orchestrating the execution, along with any relevant options.
-        # We'll start with the standard / simple pipelines for each of the allowed
-        # formats
-        converter = DocumentConverter(
-            allowed_formats=SUPPORTED_INPUT_FORMATS,
-        )
-        tokenizer = AutoTokenizer.from_pretrained(EMBED_MODEL_ID)
 
-        for path, metadata in zip(local_file_paths, file_metadatas):
+        if not local_file_paths:
+            return
+
+        # Map each in-flight future to the document it belongs to. Conversion futures
+        # return chunks, and embedding futures return vectors.
+        pool = _get_process_pool()
+        convert_futures: dict[Future[Any], VectorMetadata] = {
+            pool.submit(_convert_document, path): metadata
+            for path, metadata in zip(local_file_paths, file_metadatas, strict=True)
+        }
+        embed_futures: dict[Future[Any], VectorMetadata] = {}
+
+        # We only wait for the upserts once all documents are processed.
+        pending_upserts: list[Any] = []
+        with ThreadPoolExecutor(max_workers=EMBED_WORKERS) as embed_pool:
+            in_flight: set[Future[Any]] = set(convert_futures)
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    metadata = convert_futures.get(future) or embed_futures[future]
+                    try:
+                        if future in convert_futures:
+                            chunks = future.result()
+                            embed_future = embed_pool.submit(
+                                self.upsert_chunk_vectors,
+                                chunks,
+                                metadata.model_dump(),
+                                parent_group_id,
+                            )
+                            embed_futures[embed_future] = metadata
+                            in_flight.add(embed_future)
+                        else:
+                            vectors = future.result()
+                            pending_upserts.extend(
+                                self.upsert_vectors_async(namespace, vectors)
+                            )
+                    except ConversionError:
+                        logger.error(
+                            "Conversion failed for document: "
+                            f"{metadata.model_dump_json()}"
+                        )
+                    except Exception as e:
+                        error_metadata = {
+                            "file_metadata": metadata.model_dump(),
+                            "exception_class": e.__class__.__name__,
+                            "exception_details": str(e),
+                        }
+                        logger.error(
+                            f"Failed to process document: {json.dumps(error_metadata)}"
+                        )
+
+        for result in pending_upserts:
             try:
-                res = converter.convert(path)
-                doc = res.document
-                chunker = HybridChunker(tokenizer=tokenizer)
-                chunk_iter = chunker.chunk(dl_doc=doc)
-                chunks = list(chunk_iter)
-
-                # Upsert vectors
-                vectors = self.upsert_chunk_vectors(
-                    chunks, metadata.model_dump(), parent_group_id
-                )
-                self.index.upsert(
-                    vectors,
-                    namespace=namespace,
-                    batch_size=UPSERT_BATCH_SIZE,
-                )
-            except ConversionError:
-                logger.error(f"Conversion failed for document: {json.dumps(metadata)}")
-            except Exception as e:
-                error_metadata = {
-                    "file_metadata": metadata,
-                    "exception_class": e.__class__.__name__,
-                    "exception_details": str(e),
-                }
-                logger.error(
-                    f"Failed to process document: {json.dumps(error_metadata)}"
-                )
+                result.get()
+            except Exception:
+                logger.exception("Failed to upsert vectors")
 
     @staticmethod
     def get_record_count(parent_group_id: str) -> int:
-        res = db.all_objects(
+        return db.count_objects(
             db_type=UpsertedVector,
             where_conditions={"parent_group_id": parent_group_id},
         )
-        return len(res)
 
     async def delete_integration(self, namespace: str, integration_id: str):
         await self.async_index.delete(
@@ -32,12 +32,7 @@ class Container(containers.DeclarativeContainer):
     # For long-term conversation storage
     mongodb: Singleton[DocumentStoreClient] = providers.Singleton(
         DocumentStoreClient,
-        mongodb_driver=Settings.MONGO.DRIVER,
-        mongodb_user=Settings.MONGO.USER,
-        mongodb_password=Settings.MONGO.PASSWORD,
-        mongodb_host=Settings.MONGO.HOST,
-        mongodb_port=Settings.MONGO.PORT,
-        mongodb_options=Settings.MONGO.OPTIONS,
+        connection_uri=Settings.MONGO.create_connection_uri(),
     )
     # Redis client
     # For short-term conversation storage and worker queues
@@ -75,5 +70,8 @@ class Container(containers.DeclarativeContainer):
         auth=(Settings.NEO4J.USER, Settings.NEO4J.PASSWORD),
     )
     graph_client: Singleton[GraphClient] = providers.Singleton(
-        GraphClient, neo4j_driver=neo4j_driver, async_neo4j_driver=async_neo4j_driver
+        GraphClient,
+        neo4j_driver=neo4j_driver,
+        async_neo4j_driver=async_neo4j_driver,
+        database=Settings.NEO4J.DATABASE,
     )
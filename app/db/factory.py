@@ -1,15 +1,18 @@
 import logging
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from fastapi import HTTPException
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import orm
+from sqlalchemy import bindparam, delete, inspect, orm
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import Select
-from sqlmodel import create_engine, select
+from sqlmodel import create_engine, func, select, update
 from starlette.status import HTTP_404_NOT_FOUND
 
 from app.db.models.base import CmdAModel
@@ -21,6 +24,54 @@ T = TypeVar("T", bound=CmdAModel)
 R = TypeVar("R", bound=CmdAModel)
 
 
+# Statements are built once per model / column combination and reused across calls. The
+# values in `where_conditions` are bound at execution time. Relationships (e.g.,
+# `{"user": user}`) are compared on their foreign key columns, one parameter per column.
+def _where_params(
+    db_type: type[CmdAModel], where_conditions: dict[str, Any] | None
+) -> dict[str, Any]:
+    relationships = inspect(db_type).relationships
+    params: dict[str, Any] = {}
+    for col, value in (where_conditions or {}).items():
+        if col in relationships:
+            for _, remote in relationships[col].local_remote_pairs:
+                params[f"where_{col}_{remote.key}"] = getattr(value, remote.key)
+        else:
+            params[f"where_{col}"] = value
+    return params
+
+
+def _where_clauses(db_type: type[CmdAModel], cols: tuple[str, ...]) -> list[Any]:
+    relationships = inspect(db_type).relationships
+    clauses: list[Any] = []
+    for col in cols:
+        if col in relationships:
+            clauses.extend(
+                local == bindparam(f"where_{col}_{remote.key}")
+                for local, remote in relationships[col].local_remote_pairs
+            )
+        else:
+            clauses.append(getattr(db_type, col) == bindparam(f"where_{col}"))
+    return clauses
+
+
+@lru_cache(maxsize=256)
+def _select_stmt(
+    db_type: type[CmdAModel], cols: tuple[str, ...], order_by: tuple[str, ...] = ()
+) -> Select:
+    stmt = select(db_type).where(*_where_clauses(db_type, cols))
+    if order_by:
+        stmt = stmt.order_by(*[getattr(db_type, col) for col in order_by])
+    return stmt
+
+
+@lru_cache(maxsize=256)
+def _count_stmt(db_type: type[CmdAModel], cols: tuple[str, ...]) -> Select:
+    return (
+        select(func.count()).select_from(db_type).where(*_where_clauses(db_type, cols))
+    )
+
+
 class Database:
     def __init__(self, db_url: str, pool_size: int = 10):
         self.db_url = db_url
@@ -29,13 +80,20 @@ class Database:
         self._engine: Engine = create_engine(
             self.db_url,
             pool_size=self.pool_size,
-            max_overflow=2,
+            max_overflow=10,
             echo=False,
             pool_pre_ping=True,
+            pool_recycle=3600,
+            query_cache_size=1200,
         )
 
-        self._session_factory = orm.scoped_session(
-            orm.sessionmaker(autocommit=False, autoflush=False, bind=self._engine)
+        # Objects keep their loaded state after commit, so we don't need to refresh
+        # them. All of our column defaults are set client-side.
+        self._session_factory = orm.sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=self._engine,
         )
 
     @contextmanager
@@ -56,11 +114,14 @@ class Database:
         where_conditions: dict[str, Any],
         session: Session | None = None,
         headers: dict[str, str] | None = None,
+        load_options: list[Any] | None = None,
     ) -> T:
         """
         Get specific database object that match the criteria defined in the statement.
         """
-        db_objects = self.all_objects(db_type, where_conditions, session)
+        db_objects = self.all_objects(
+            db_type, where_conditions, session, load_options=load_options
+        )
         if not db_objects:
             raise HTTPException(
                 status_code=HTTP_404_NOT_FOUND,
@@ -76,14 +137,9 @@ class Database:
         where_conditions: dict[str, Any] | None = None,
         session: Session | None = None,
     ) -> Page[T]:
-        where_bool_clause_list = []
-        for col, value in (where_conditions or {}).items():
-            where_bool_clause_list.append(getattr(db_type, col) == value)
-        stmt = (
-            select(db_type)
-            .where(*where_bool_clause_list)
-            .order_by(*[getattr(db_type, col) for col in order_by])
-        )
+        stmt = _select_stmt(
+            db_type, tuple(where_conditions or {}), tuple(order_by)
+        ).params(**_where_params(db_type, where_conditions))
         if session:
             return paginate(session, stmt)
 
@@ -97,24 +153,42 @@ class Database:
         where_conditions: dict[str, Any] | None = None,
         session: Session | None = None,
         order_by: list[str] | None = None,
+        load_options: list[Any] | None = None,
     ) -> list[T]:
         """
         Get all database objects that match the criteria defined in the statement.
+        `load_options` (e.g., `joinedload(...)`) control how relationships are loaded.
         """
-        where_bool_clause_list = []
-        for col, value in (where_conditions or {}).items():
-            where_bool_clause_list.append(getattr(db_type, col) == value)
-        stmt = select(db_type).where(*where_bool_clause_list)
-        if order_by:
-            stmt = stmt.order_by(*[getattr(db_type, col) for col in order_by])
+        stmt = _select_stmt(
+            db_type, tuple(where_conditions or {}), tuple(order_by or ())
+        )
+        if load_options:
+            stmt = stmt.options(*load_options)
+        params = _where_params(db_type, where_conditions)
         if session:
-            res = session.execute(stmt)
-            return [row._asdict()[db_type.__name__] for row in res.all()]
+            return list(session.scalars(stmt, params).all())
 
         # Otherwise, create a session and execute
         with self.session() as new_session:
-            res = new_session.execute(stmt)
-            return [row._asdict()[db_type.__name__] for row in res.all()]
+            return list(new_session.scalars(stmt, params).all())
+
+    def count_objects(
+        self,
+        db_type: type[T],
+        where_conditions: dict[str, Any] | None = None,
+        session: Session | None = None,
+    ) -> int:
+        """
+        Count the database objects that match the criteria defined in the statement.
+        """
+        stmt = _count_stmt(db_type, tuple(where_conditions or {}))
+        params = _where_params(db_type, where_conditions)
+        if session:
+            return session.execute(stmt, params).scalar_one()
+
+        # Otherwise, create a session and execute
+        with self.session() as new_session:
+            return new_session.execute(stmt, params).scalar_one()
 
     def execute_stmt(
         self,
@@ -140,18 +214,54 @@ class Database:
         headers: dict[str, str] | None = None,
         **kwargs,
     ) -> T:
+        """
+        Update the single object that `get_object` returns for `where_conditions`.
+        """
         with self.session() as session:
             obj = self.get_object(db_type, where_conditions, session, headers)
-            for attr, val in kwargs.items():
-                setattr(obj, attr, val)
+            # Filter on the primary key, so only this row is updated even if the where
+            # conditions match several. UPDATE ... RETURNING updates and fetches the row
+            # in a single round trip.
+            stmt = (
+                update(db_type)
+                .where(db_type.id == obj.id)  # type: ignore
+                .values(**kwargs)
+                .returning(db_type)
+            )
+            updated_obj = session.execute(stmt).scalar_one()
             session.commit()
-            session.refresh(obj)
+        return updated_obj
 
-        # Return the updated object
-        updated_obj = self.get_object(
-            db_type, where_conditions, session=None, headers=headers
+    def update_objects(
+        self,
+        db_type: type[T],
+        where_conditions: dict[str, Any],
+        session: Session | None = None,
+        **kwargs,
+    ) -> int:
+        """
+        Update all database objects that match the criteria with a single UPDATE
+        statement, without loading them. Returns the number of updated rows.
+        """
+        where_bool_clause_list = []
+        for col, value in where_conditions.items():
+            where_bool_clause_list.append(getattr(db_type, col) == value)
+        stmt = (
+            update(db_type)
+            .where(*where_bool_clause_list)
+            .values(**kwargs)
+            .execution_options(synchronize_session=False)
         )
-        return updated_obj
+        if session:
+            res = session.execute(stmt)
+            session.commit()
+            return res.rowcount  # type: ignore
+
+        # Otherwise, create a session and execute
+        with self.session() as new_session:
+            res = new_session.execute(stmt)
+            new_session.commit()
+        return res.rowcount  # type: ignore
 
     def get_object_fk_attribute(
         self,
@@ -177,13 +287,68 @@ class Database:
             with self.session() as new_session:
                 new_session.add(db_object)
                 new_session.commit()
-                new_session.refresh(db_object)
         else:
             session.add(db_object)
             session.commit()
-            session.refresh(db_object)
         return db_object
 
+    def add_many(
+        self,
+        db_objects: list[T],
+        ignore_conflicts: bool = False,
+        session: Session | None = None,
+        conflict_cols: list[str] | None = None,
+    ) -> None:
+        """
+        Insert all objects with a single statement in a single transaction. If
+        `ignore_conflicts` is True, rows that conflict with existing rows (e.g., on a
+        unique column) are skipped by the server instead of failing the whole insert.
+        Pass `conflict_cols` to only skip conflicts on those columns' unique index.
+        Objects must all be of the same type.
+        """
+        if not db_objects:
+            return
+
+        table = type(db_objects[0]).__table__  # type: ignore
+        rows = [
+            {c.name: getattr(obj, c.name) for c in table.columns} for obj in db_objects
+        ]
+        insert_fn = (
+            postgresql_insert
+            if self._engine.dialect.name == "postgresql"
+            else sqlite_insert
+        )
+        stmt = insert_fn(table).values(rows)
+        if ignore_conflicts:
+            stmt = stmt.on_conflict_do_nothing(index_elements=conflict_cols)
+
+        if session:
+            session.execute(stmt)
+            session.commit()
+            return
+
+        # Otherwise, create a session and execute
+        with self.session() as new_session:
+            new_session.execute(stmt)
+            new_session.commit()
+
+    def delete_by_ids(self, db_type: type[T], ids: list[Any]) -> int:
+        """
+        Delete the objects with the given primary keys with a single DELETE statement,
+        without loading them. Returns the number of deleted rows.
+        """
+        if not ids:
+            return 0
+        stmt = (
+            delete(db_type)
+            .where(db_type.id.in_(ids))  # type: ignore
+            .execution_options(synchronize_session=False)
+        )
+        with self.session() as session:
+            res = session.execute(stmt)
+            session.commit()
+        return res.rowcount  # type: ignore
+
     def delete(self, db_object: T) -> None:
         with self.session() as session:
             session.delete(db_object)
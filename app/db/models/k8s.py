@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID
 
 from pydantic import model_validator
-from sqlmodel import Field, Relationship, UniqueConstraint
+from sqlmodel import Field, Relationship, UniqueConstraint, func
 
 from app.db.models.base import CmdAModel
 from app.db.models.choices import ExecutionRole, KubernetesResourceType, SecretType
@@ -14,12 +14,19 @@ class Secret(CmdAModel, table=True):  # type: ignore
     __table_args__ = (
         UniqueConstraint("name", "namespace", name="unique_name_namespace"),
     )
+    # Fetch server-generated values (i.e., `updated_at`) as part of each INSERT / UPDATE
+    __mapper_args__: ClassVar[dict[str, Any]] = {"eager_defaults": True}
 
     type: SecretType
     name: str
     slug: str
     namespace: str
-    updated_at: datetime = Field(default_factory=datetime.now)
+    # Set by the database on insert and on every update
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
 
     # Relationships
     # `uselist` is for one-to-one relationships
@@ -1,14 +1,18 @@
+import base64
 import logging
 import os
+import time
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 from typing import Annotated, Any
 
 import jwt
+from cachetools import TTLCache
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends
 from fastapi.exceptions import HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from jwt import PyJWTError
+from jwt import PyJWK, PyJWTError
 from starlette.status import HTTP_401_UNAUTHORIZED
 
 from app.db.container import Container
@@ -22,10 +26,54 @@ SECRET_KEY = os.getenv("CMDA_AUTH_SECRET_KEY", "your-secret-key")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# The signing key is prepared once. PyJWT otherwise re-validates a raw string key (e.g.,
+# checks that it isn't a PEM / SSH key) on every encode and decode.
+SIGNING_KEY = PyJWK(
+    {
+        "kty": "oct",
+        "k": base64.urlsafe_b64encode(SECRET_KEY.encode()).rstrip(b"=").decode(),
+    },
+    algorithm=ALGORITHM,
+)
+
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
+# Users looked up by `get_current_user`, keyed by token. Each entry also stores the
+# token's expiry, so a cached token is never accepted after it expires.
+_USER_CACHE: TTLCache[str, tuple[User, float]] = TTLCache(maxsize=4096, ttl=60)
+_USER_CACHE_LOCK = Lock()
+
+# Verified token payloads, keyed by token. A token can't outlive its TTL, and the
+# payload's own expiry is re-checked on every hit.
+_PAYLOAD_CACHE: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=8192, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+_PAYLOAD_CACHE_LOCK = Lock()
+
+
+def evict_cached_user(user_id: str) -> None:
+    """Drop all cached tokens for a user, e.g., after the user is updated or deleted."""
+    with _USER_CACHE_LOCK:
+        for token, (user, _) in list(_USER_CACHE.items()):
+            if str(user.id) == str(user_id):
+                _USER_CACHE.pop(token, None)
+
+
+def _decode_token(token: str) -> dict[str, Any]:
+    """Decode and verify a JWT, reusing the payload of previously verified tokens."""
+    with _PAYLOAD_CACHE_LOCK:
+        payload = _PAYLOAD_CACHE.get(token)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    payload = jwt.decode(token, SIGNING_KEY, algorithms=[ALGORITHM])
+    with _PAYLOAD_CACHE_LOCK:
+        _PAYLOAD_CACHE[token] = payload
+    return payload
+
+
 def create_access_token(data: dict[str, Any]) -> str:
     """
     Create encoded JWT with user data
@@ -33,7 +81,7 @@ def create_access_token(data: dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
@@ -47,8 +95,13 @@ def get_current_user(
         detail="Could not validate credentials.",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    with _USER_CACHE_LOCK:
+        cached = _USER_CACHE.get(token)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token)
     except PyJWTError:
         raise credentials_exception
 
@@ -61,4 +114,6 @@ def get_current_user(
         where_conditions={"username": username},
         headers={"WWW-Authenticate": "Bearer"},
     )
+    with _USER_CACHE_LOCK:
+        _USER_CACHE[token] = (user, payload.get("exp", 0))
     return user
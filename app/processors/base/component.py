@@ -1,7 +1,9 @@
 import logging
-import sys
 from abc import ABC
-from datetime import datetime
+from functools import cached_property
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 
 from app.clients.k8s_client import KubernetesOperator
 from app.clients.redis_client import RedisClient
@@ -11,16 +13,8 @@ from app.db.models.integration import Integration, ParentGroupData
 from app.db.models.k8s import Secret
 
 # Logger
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
-# Send logs to stdout
-ch = logging.StreamHandler(sys.stdout)
-ch.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
-logger.addHandler(ch)
-
 
 class BaseProcessingComponent(KubernetesOperator, ABC):
     """
@@ -33,7 +27,6 @@ class BaseProcessingComponent(KubernetesOperator, ABC):
     integration_id: str
     namespace: str
     integration: Integration
-    integration_secret: Secret
 
     def __init__(
         self,
@@ -52,61 +45,61 @@ class BaseProcessingComponent(KubernetesOperator, ABC):
 
         # Database objects
         with self.db.session() as session:
-            # Run for all integrations
+            # Run for all integrations. The user and secret are loaded in the same
+            # query.
             integration = db.get_object(
                 db_type=Integration,
                 where_conditions={"id": self.integration_id},
                 session=session,
+                load_options=[
+                    joinedload(Integration.user),  # type: ignore
+                    joinedload(Integration.secret),  # type: ignore
+                ],
             )
             if integration.user.namespace != self.namespace:
                 raise Exception(
                     f"Tried retrieving data from user in namespace `{integration.user.namespace}`! This indicates leakage in the underlying Kubernetes architecture."
                 )
             self.integration = integration
-            self.integration_secret = integration.secret
+
+    @cached_property
+    def integration_secret(self) -> Secret:
+        """The integration's secret, loaded alongside the integration."""
+        return self.integration.secret
 
     def update_integration_status_last_run(self) -> None:
         """Update Integration `last_run` and `status` fields. This is used when the
         scheduler has scheduled all of the integration's parent data groups (e.g., all
         Slack channels have been queued).
         """
-        with self.db.session() as session:
-            integration = self.db.get_object(
-                db_type=Integration,
-                where_conditions={"id": self.integration_id},
-                session=session,
-            )
-            integration.last_run = datetime.now()
-            integration.status = IntegrationStatus.RUNNING
-            session.commit()
-            session.refresh(integration)
+        self.db.update_objects(
+            db_type=Integration,
+            where_conditions={"id": self.integration_id},
+            last_run=func.now(),
+            status=IntegrationStatus.RUNNING,
+        )
 
-    def set_integration_status(self, status: IntegrationStatus) -> None:
+    def set_integration_status(
+        self, status: IntegrationStatus, session: Session | None = None
+    ) -> None:
         """Update Integration `status` field. This is generally used to set the
         integration status to FAILED or SUCCESS."""
-        with self.db.session() as session:
-            integration = self.db.get_object(
-                db_type=Integration,
-                where_conditions={"id": self.integration_id},
-                session=session,
-            )
-            integration.status = status
-            session.commit()
-            session.refresh(integration)
+        self.db.update_objects(
+            db_type=Integration,
+            where_conditions={"id": self.integration_id},
+            session=session,
+            status=status,
+        )
 
     def set_parent_group_data_status(
         self, parent_group_id: str, status: IntegrationStatus
     ) -> None:
-        with self.db.session() as session:
-            parent_group_data = self.db.get_object(
-                db_type=ParentGroupData,
-                where_conditions={
-                    "parent_group_id": parent_group_id,
-                    "integration_id": self.integration_id,
-                },
-                session=session,
-            )
-            parent_group_data.last_run = datetime.now()
-            parent_group_data.status = status
-            session.commit()
-            session.refresh(parent_group_data)
+        self.db.update_objects(
+            db_type=ParentGroupData,
+            where_conditions={
+                "parent_group_id": parent_group_id,
+                "integration_id": self.integration_id,
+            },
+            last_run=func.now(),
+            status=status,
+        )
@@ -1,13 +1,13 @@
-import json
 import logging
 import re
-import sys
 from abc import abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 
-from app.clients.graph_client import GraphClient
+from app.clients.graph_client import Edge, GraphClient, Node
 from app.clients.redis_client import RedisClient
 from app.clients.vectordb_client import VectorDb
 from app.db.factory import Database
@@ -17,20 +17,30 @@ from app.processors.base.component import BaseProcessingComponent
 from app.processors.base.types import ProcessingChunk
 
 # Logger
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
-# Send logs to stdout
-ch = logging.StreamHandler(sys.stdout)
-ch.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
-logger.addHandler(ch)
-
-
 T = TypeVar("T", bound=ProcessingChunk)
 
+# Markdown patterns
+# User tags: Slack-style, GitHub-style, custom markdown, and email-like mentions
+_SLACK_TAG_RE = re.compile(r"<@(U[A-Z0-9]+)(?:\|([^>]+))?>")
+_GITHUB_TAG_RE = re.compile(
+    r"(?<!\w)@([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})"
+)
+_CUSTOM_TAG_RE = re.compile(r"\[@([^\]]+)\]\(user:([^)]+)\)")
+_EMAIL_TAG_RE = re.compile(
+    r"(?<!\S)([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})(?!\S)"
+)
+# Links: inline, reference definitions / usages, and bare URLs
+_INLINE_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_REF_DEFINITION_RE = re.compile(
+    r'^[ \t]*\[([^\]\n]+)\]:[ \t]*(\S+)(?:[ \t]+"([^"\n]+)")?[ \t\r]*$',
+    re.MULTILINE,
+)
+_REF_USAGE_RE = re.compile(r"\[([^\]]+)\]\[([^\]]*)\]")
+_BARE_URL_RE = re.compile(r'(?<!\(|\[)(https?://[^\s<>"\')]+)(?!\)|\])')
+
 
 class MarkdownLink(BaseModel):
     text: str
@@ -54,6 +64,11 @@ class BaseProcessor(BaseProcessingComponent, Generic[T]):
     graph_client: GraphClient
     vector_db: VectorDb
 
+    # Graph entities queued for the current content item. These are written to Neo4J in
+    # batches via `flush_graph_entities`.
+    pending_nodes: list[Node]
+    pending_edges: list[Edge]
+
     # Parent group data from database
     parent_group_data: ParentGroupData
     # Chunk class and data
@@ -82,6 +97,8 @@ class BaseProcessor(BaseProcessingComponent, Generic[T]):
         self.chunk_key = chunk_key
         self.graph_client = graph_client
         self.vector_db = vector_db
+        self.pending_nodes = []
+        self.pending_edges = []
 
         # Chunk data
         chunk_data = self.redis_client.simple_get(self.chunk_key)
@@ -90,7 +107,7 @@ class BaseProcessor(BaseProcessingComponent, Generic[T]):
                 f"Could not find any data in Redis with key `{self.chunk_key}`!"
             )
         self.set_chunk_cls()
-        self.chunk = self.chunk_cls(**json.loads(chunk_data))
+        self.chunk = self.chunk_cls.model_validate_json(chunk_data)
 
         # Parent Group database object
         parent_group_data_obj = self.db.get_object(
@@ -116,10 +133,50 @@ class BaseProcessor(BaseProcessingComponent, Generic[T]):
     def num_processed_edges(self) -> int:
         return self.graph_client.get_edge_count(self.chunk.parent_group_id)
 
+    @property
+    def num_processed_nodes_edges(self) -> tuple[int, int]:
+        return self.graph_client.get_counts(self.chunk.parent_group_id)
+
     @property
     def num_processed_records(self) -> int:
         return self.vector_db.get_record_count(self.chunk.parent_group_id)
 
+    def _counts(self) -> tuple[int, int, int]:
+        """Node, edge, and record counts, querying the graph and records concurrently"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            records_future = executor.submit(
+                self.vector_db.get_record_count, self.chunk.parent_group_id
+            )
+            node_count, edge_count = self.num_processed_nodes_edges
+            return node_count, edge_count, records_future.result()
+
+    def queue_node(self, node: Node) -> None:
+        self.pending_nodes.append(node)
+
+    def queue_edge(self, edge: Edge) -> None:
+        self.pending_edges.append(edge)
+
+    def flush_pending_nodes(self) -> None:
+        if self.pending_nodes:
+            self.graph_client.add_nodes_batch(self.pending_nodes)
+            self.pending_nodes = []
+
+    def flush_graph_entities(self) -> None:
+        """Write queued nodes, then queued edges, to Neo4J. Nodes must be written first,
+        since edges are created by matching on their endpoints' IDs.
+        """
+        self.flush_pending_nodes()
+        if self.pending_edges:
+            self.graph_client.add_edges_batch(self.pending_edges)
+            self.pending_edges = []
+
+    def get_nodes_from_url(self, url: str) -> list[Any]:
+        """Entity resolution via URL. Queued nodes are written first so that they are
+        visible to the lookup.
+        """
+        self.flush_pending_nodes()
+        return self.graph_client.get_nodes_from_url(url)
+
     def parse_markdown_user_tags(self, markdown_text: str) -> list[MarkdownUserTag]:
         """
         Extract user tags/mentions from markdown text.
@@ -129,50 +186,55 @@ class BaseProcessor(BaseProcessingComponent, Generic[T]):
         - GitHub-style: @username
         - Custom markdown: [@username](user:username)
         """
+        # Matches are always strings, so we build the models without validating them.
         tags = []
 
-        # Slack-style mentions: <@U12345> or <@U12345|display_name>
-        slack_pattern = r"<@(U[A-Z0-9]+)(?:\|([^>]+))?>"
-        for match in re.finditer(slack_pattern, markdown_text):
-            groups = match.groups()
-            user_id = groups[0]
-            display_text = groups[1] if len(groups) > 1 and groups[1] else user_id
-
-            tags.append(
-                MarkdownUserTag(
-                    tag_type="slack",
-                    user_id=user_id,
-                    display_text=display_text,
+        # Every tag format contains an `@`, so there is nothing to scan for without one
+        if "@" not in markdown_text:
+            return tags
+
+        if "<@" in markdown_text:
+            # Slack-style mentions: <@U12345> or <@U12345|display_name>
+            for match in _SLACK_TAG_RE.finditer(markdown_text):
+                groups = match.groups()
+                user_id = groups[0]
+                display_text = groups[1] if len(groups) > 1 and groups[1] else user_id
+
+                tags.append(
+                    MarkdownUserTag.model_construct(
+                        tag_type="slack",
+                        user_id=user_id,
+                        display_text=display_text,
+                    )
                 )
-            )
 
         # GitHub-style mentions: @username
         # Username pattern based on GitHub's rules: alphanumeric with single hyphens in between
-        github_pattern = r"(?<!\w)@([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})"
-        for match in re.finditer(github_pattern, markdown_text):
+        for match in _GITHUB_TAG_RE.finditer(markdown_text):
             username = match.group(1)
             tags.append(
-                MarkdownUserTag(
+                MarkdownUserTag.model_construct(
                     tag_type="github", user_id=username, display_text=f"@{username}"
                 )
             )
 
-        # Custom markdown user links: [@username](user:username)
-        custom_pattern = r"\[@([^\]]+)\]\(user:([^)]+)\)"
-        for match in re.finditer(custom_pattern, markdown_text):
-            display_name, username = match.groups()
-            tags.append(
-                MarkdownUserTag(
-                    tag_type="custom", user_id=username, display_text=display_name
+        if "[@" in markdown_text:
+            # Custom markdown user links: [@username](user:username)
+            for match in _CUSTOM_TAG_RE.finditer(markdown_text):
+                display_name, username = match.groups()
+                tags.append(
+                    MarkdownUserTag.model_construct(
+                        tag_type="custom", user_id=username, display_text=display_name
+                    )
                 )
-            )
 
         # Email-like mentions: user@domain.com
-        email_pattern = r"(?<!\S)([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})(?!\S)"
-        for match in re.finditer(email_pattern, markdown_text):
+        for match in _EMAIL_TAG_RE.finditer(markdown_text):
             email = match.group(1)
             tags.append(
-                MarkdownUserTag(tag_type="email", user_id=email, display_text=email)
+                MarkdownUserTag.model_construct(
+                    tag_type="email", user_id=email, display_text=email
+                )
             )
 
         return tags
@@ -186,48 +248,51 @@ class BaseProcessor(BaseProcessingComponent, Generic[T]):
         - Reference-style links: [text][reference] ... [reference]: url
         - Bare URLs: http(s)://example.com
         """
+        # Matches are always strings, so we build the models without validating them.
         links = []
 
-        # Pattern for standard markdown links: [text](url)
-        inline_pattern = r"\[([^\]]+)\]\(([^)]+)\)"
-        for match in re.finditer(inline_pattern, markdown_text):
-            text, url = match.groups()
-            links.append(MarkdownLink(text=text.strip(), url=url.strip()))
-
-        # Pattern for reference-style links
-        # First find all reference definitions: [ref]: url
-        references = {}
-        ref_pattern = r'^\s*\[([^\]]+)\]:\s*(\S+)(?:\s+"([^"]+)")?\s*$'
-        for line in markdown_text.split("\n"):
-            ref_match = re.match(ref_pattern, line)
-            if ref_match:
-                ref_id, url, title = (
-                    ref_match.groups()
-                    if len(ref_match.groups()) == 3
-                    else (*ref_match.groups(), None)
+        # Each pass needs a literal marker that can be found with a cheap substring
+        # check before running any regex: `](` for inline links, `]:` for reference
+        # definitions (without one, no usage can resolve), and `http` for bare URLs.
+        if "](" in markdown_text:
+            # Pattern for standard markdown links: [text](url)
+            for match in _INLINE_LINK_RE.finditer(markdown_text):
+                text, url = match.groups()
+                links.append(
+                    MarkdownLink.model_construct(text=text.strip(), url=url.strip())
                 )
+
+        if "]:" in markdown_text:
+            # Pattern for reference-style links
+            # First find all reference definitions: [ref]: url
+            references = {}
+            for ref_match in _REF_DEFINITION_RE.finditer(markdown_text):
+                ref_id, url = ref_match.group(1, 2)
                 references[ref_id.lower()] = url
 
-        # Then find all reference usages: [text][ref]
-        ref_usage_pattern = r"\[([^\]]+)\]\[([^\]]*)\]"
-        for ref_usage_match in re.finditer(ref_usage_pattern, markdown_text):
-            text, ref_id = ref_usage_match.groups()
-            # If ref_id is empty, use text as the reference
-            ref_id = ref_id.lower() if ref_id else text.lower()
-            if ref_id in references:
-                links.append(MarkdownLink(text=text.strip(), url=references[ref_id]))
+            # Then find all reference usages: [text][ref]
+            for ref_usage_match in _REF_USAGE_RE.finditer(markdown_text):
+                text, ref_id = ref_usage_match.groups()
+                # If ref_id is empty, use text as the reference
+                ref_id = ref_id.lower() if ref_id else text.lower()
+                if ref_id in references:
+                    links.append(
+                        MarkdownLink.model_construct(
+                            text=text.strip(), url=references[ref_id]
+                        )
+                    )
 
         # Pattern for bare URLs
-        url_pattern = r'(?<!\(|\[)(https?://[^\s<>"\')]+)(?!\)|\])'
-        for bare_match in re.finditer(url_pattern, markdown_text):
-            url = bare_match.group(1)
-            links.append(MarkdownLink(text=url, url=url))
+        if "http" in markdown_text:
+            for bare_match in _BARE_URL_RE.finditer(markdown_text):
+                url = bare_match.group(1)
+                links.append(MarkdownLink.model_construct(text=url, url=url))
 
         return links
 
     @abstractmethod
     def save_chunk_graph_entities(self, content: dict[str, Any]) -> None:
-        """Process graph entities (nodes, edges) and save to Neo4J"""
+        """Process graph entities (nodes, edges) and queue them for Neo4J"""
         pass
 
     @abstractmethod
@@ -235,20 +300,18 @@ class BaseProcessor(BaseProcessingComponent, Generic[T]):
         """Process chunk content (text and files) and save to Pinecone"""
         pass
 
-    def update_parent_group_data_count_attributes(self, attributes: dict[str, int]):
-        with self.db.session() as session:
-            parent_group_data = self.db.get_object(
-                db_type=ParentGroupData,
-                where_conditions={
-                    "parent_group_id": self.chunk.parent_group_id,
-                    "integration_id": self.integration_id,
-                },
-                session=session,
-            )
-            for count_attr, count_value in attributes.items():
-                setattr(parent_group_data, count_attr, count_value)
-            session.commit()
-            session.refresh(parent_group_data)
+    def update_parent_group_data_count_attributes(
+        self, attributes: dict[str, int], session: Session | None = None
+    ):
+        self.db.update_objects(
+            db_type=ParentGroupData,
+            where_conditions={
+                "parent_group_id": self.chunk.parent_group_id,
+                "integration_id": self.integration_id,
+            },
+            session=session,
+            **attributes,
+        )
 
     def process_chunk_data(self) -> None:
         """Process the actual chunk data"""
@@ -257,55 +320,57 @@ class BaseProcessor(BaseProcessingComponent, Generic[T]):
             "chunk_id": self.chunk.id,
         }
 
-        # Update the database after each chunk. This may lead to a bunch of database
-        # requests, in which case we can adjust this to update after all chunks are
-        # processed.
-        for content in self.chunk.content:
-            try:
-                self.save_chunk_graph_entities(content=content)
-                self.update_parent_group_data_count_attributes(
-                    {
-                        "node_count": self.num_processed_nodes,
-                        "edge_count": self.num_processed_edges,
-                    }
+        # Embeddings don't depend on the graph, so each content item's upsert runs in
+        # the background while the next item's graph entities are saved. Upserts still
+        # run one at a time, since downloaded files share a directory.
+        with ThreadPoolExecutor(max_workers=1) as embed_executor:
+            upsert_futures: list[Future[None]] = []
+            for content in self.chunk.content:
+                try:
+                    self.save_chunk_graph_entities(content=content)
+                    self.flush_graph_entities()
+                except Exception as e1:
+                    embed_executor.shutdown(cancel_futures=True)
+                    error_json["detail"] = str(e1)
+                    logger.error("Error saving the graph entities: %s", error_json)
+                    # We update the integration / parent group status based on the
+                    # statuses of all associated processing jobs via a Websocket.
+                    self.set_chunk_processing_job_status(IntegrationStatus.FAILED)
+                    raise
+
+                upsert_futures.append(
+                    embed_executor.submit(self.upsert_chunk_embeddings, content=content)
                 )
 
-            except Exception as e1:
-                error_json["detail"] = str(e1)
-                logger.error(
-                    f"Error saving the graph entities: {json.dumps(error_json)}"
-                )
-                # We update the integration / parent group status based on the statuses
-                # of all associated processing jobs via a Websocket.
-                self.set_chunk_processing_job_status(IntegrationStatus.FAILED)
-                raise
-
-            try:
-                self.upsert_chunk_embeddings(content=content)
-                self.update_parent_group_data_count_attributes(
-                    {
-                        "record_count": self.num_processed_records,
-                    }
-                )
-            except Exception as e2:
-                error_json["detail"] = str(e2)
-                logger.error(
-                    f"Error upserting chunk embeddings: {json.dumps(error_json)}"
-                )
-                # We update the integration / parent group status based on the statuses
-                # of all associated processing jobs via a Websocket.
-                self.set_chunk_processing_job_status(IntegrationStatus.FAILED)
-                raise
-
-        self.set_integration_status(IntegrationStatus.SUCCESS)
-
-    def set_chunk_processing_job_status(self, status: IntegrationStatus) -> None:
+            for future in upsert_futures:
+                try:
+                    future.result()
+                except Exception as e2:
+                    embed_executor.shutdown(cancel_futures=True)
+                    error_json["detail"] = str(e2)
+                    logger.error("Error upserting chunk embeddings: %s", error_json)
+                    # We update the integration / parent group status based on the
+                    # statuses of all associated processing jobs via a Websocket.
+                    self.set_chunk_processing_job_status(IntegrationStatus.FAILED)
+                    raise
+
+        # The counts are totals for the whole parent group, so we only need to read and
+        # store them once all of the chunk's content has been processed.
+        node_count, edge_count, record_count = self._counts()
         with self.db.session() as session:
-            processing_job_db_obj = self.db.get_object(
-                db_type=ChunkProcessingJob,
-                where_conditions={"id": self.job_id},
+            self.update_parent_group_data_count_attributes(
+                {
+                    "node_count": node_count,
+                    "edge_count": edge_count,
+                    "record_count": record_count,
+                },
                 session=session,
             )
-            processing_job_db_obj.status = status
-            session.commit()
-            session.refresh(processing_job_db_obj)
+            self.set_integration_status(IntegrationStatus.SUCCESS, session=session)
+
+    def set_chunk_processing_job_status(self, status: IntegrationStatus) -> None:
+        self.db.update_objects(
+            db_type=ChunkProcessingJob,
+            where_conditions={"id": self.job_id},
+            status=status,
+        )
@@ -1,8 +1,7 @@
-import json
 import logging
-import sys
 from abc import abstractmethod
-from datetime import datetime
+
+from sqlalchemy import func, update
 
 from app.db.models.choices import IntegrationStatus
 from app.db.models.integration import Integration, ParentGroupData
@@ -10,16 +9,8 @@ from app.processors.base.component import BaseProcessingComponent
 from app.processors.base.types import ProcessingParentGroupData
 
 # Logging
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
-# Send logs to stdout
-ch = logging.StreamHandler(sys.stdout)
-ch.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
-logger.addHandler(ch)
-
 
 class BaseScheduler(BaseProcessingComponent):
     """Base class for all integration schedulers"""
@@ -38,41 +29,45 @@ class BaseScheduler(BaseProcessingComponent):
         """
         pass
 
-    def add_to_queue(self, data: ProcessingParentGroupData) -> None:
-        """Add parent group data to Redis queue"""
+    def add_to_queue(self, parent_groups: list[ProcessingParentGroupData]) -> None:
+        """Add parent group data to Redis queue. All groups are pushed with a single
+        LPUSH, in order."""
+        if not parent_groups:
+            return
         queue_key = f"queue:{self.integration.type}:{self.integration_id}"
-        logger.info(f"Adding {data._pretty_type} {data.id} to queue")
-        self.redis_client.simple_lpush(queue_key, data.model_dump_json())
+        for data in parent_groups:
+            logger.info(f"Adding {data._pretty_type} {data.id} to queue")
+        self.redis_client.simple_lpush(
+            queue_key, *[data.model_dump_json() for data in parent_groups]
+        )
 
     def enqueue_parent_groups(self):
         """Get all active parent groups that need to be processed"""
         parent_groups = self.get_parent_groups()
-        for group in parent_groups:
-            self.add_to_queue(group)
+        self.add_to_queue(parent_groups)
 
-            # Update the parent group's status
-            self.db.update_object(
-                db_type=ParentGroupData,
-                where_conditions={
-                    "parent_group_id": group.id,
-                    "integration_id": self.integration_id,
-                },
-                status=IntegrationStatus.QUEUED,
+        # Update the parent groups' statuses and the integration's `last_run` and status
+        # in a single transaction. We update the integration's `last_run` when the
+        # integration's parent groups are added to the queue. We update each parent
+        # group's `last_run` when all of their processing jobs have been kicked off.
+        with self.db.session() as session:
+            if parent_groups:
+                session.execute(
+                    update(ParentGroupData)
+                    .where(
+                        ParentGroupData.integration_id == self.integration_id,  # type: ignore
+                        ParentGroupData.parent_group_id.in_(  # type: ignore
+                            [group.id for group in parent_groups]
+                        ),
+                    )
+                    .values(status=IntegrationStatus.QUEUED)
+                )
+            session.execute(
+                update(Integration)
+                .where(Integration.id == self.integration_id)  # type: ignore
+                .values(status=IntegrationStatus.QUEUED, last_run=func.now())
             )
-
-        # Update integration last_run and status. We update the integration's `last_run`
-        # when the integration's parent groups are added to the queue. We update each
-        # parent group's `last_run` when all of their processing jobs have been kicked
-        # off.
-        self.db.update_object(
-            db_type=Integration,
-            where_conditions={
-                "id": self.integration_id,
-            },
-            headers=None,
-            status=IntegrationStatus.QUEUED,
-            last_run=datetime.now(),
-        )
+            session.commit()
 
     def run(self) -> None:
         """Main scheduling loop"""
@@ -84,5 +79,5 @@ class BaseScheduler(BaseProcessingComponent):
                 "namespace": self.namespace,
                 "detail": str(e),
             }
-            logger.error(f"Scheduler error: {json.dumps(error_json)}")
+            logger.error("Scheduler error: %s", error_json)
             raise
@@ -1,10 +1,20 @@
-import re
+from functools import cached_property
 from typing import Any
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from app.db.models.choices import ParentGroupDataType
 
+# Maps every byte that isn't allowed in Kubernetes object names to `-`
+_K8S_ALLOWED = frozenset(b"abcdefghijklmnopqrstuvwxyz0123456789-.")
+_K8S_SANITIZE_TABLE = bytes(c if c in _K8S_ALLOWED else ord("-") for c in range(256))
+
+# Human-readable name for each parent group type (e.g., `slack_channel` ->
+# `Slack Channel`)
+_PRETTY_TYPES: dict[ParentGroupDataType, str] = {
+    t: " ".join([word.title() for word in t.split("_")]) for t in ParentGroupDataType
+}
+
 
 class ProcessingParentGroupData(BaseModel):
     """Base class for parent data groups (e.g., Slack channel, GitHub repo)"""
@@ -20,8 +30,7 @@ class ProcessingParentGroupData(BaseModel):
 
     @model_validator(mode="after")
     def make_pretty(self) -> "ProcessingParentGroupData":
-        split = self.type.split("_")
-        self._pretty_type = " ".join([word.title() for word in split])
+        self._pretty_type = _PRETTY_TYPES[self.type]
         return self
 
 
@@ -34,10 +43,16 @@ class ProcessingChunk(BaseModel):
     ts: str | None
     content: list[dict[str, Any]]
 
-    @property
+    @cached_property
     def k8s_parent_group_id(self) -> str:
         # Create a job that name adheres to Kubernetes standards. Per the documentation:
         #   a lowercase RFC 1123 subdomain must consist of lower case alphanumeric
         #   characters, '-' or '.', and must start and end with an alphanumeric
         #   character (e.g. 'example.com')
-        return re.sub(r"([^a-z0-9-.])", "-", self.parent_group_id.lower())
+        # Non-ASCII characters are encoded as `?`, so they're replaced too.
+        return (
+            self.parent_group_id.lower()
+            .encode("ascii", "replace")
+            .translate(_K8S_SANITIZE_TABLE)
+            .decode()
+        )
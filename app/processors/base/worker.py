@@ -1,14 +1,14 @@
 import asyncio
-import json
+import copy
 import logging
-import sys
-import time
 from abc import abstractmethod
-from datetime import datetime
-from typing import Generator
+from functools import cached_property
+from itertools import batched
+from typing import Any, Generator
 from uuid import uuid4
 
 from kubernetes import client
+from sqlalchemy import func
 
 from app.db.models.choices import IntegrationStatus
 from app.db.models.integration import ChunkProcessingJob, ParentGroupData
@@ -18,15 +18,10 @@ from app.processors.utils import create_job_input_redis_key
 from app.settings import DeploymentMode, PostgresDatabaseConfig, Settings
 
 # Logging
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
-# Send logs to stdout
-ch = logging.StreamHandler(sys.stdout)
-ch.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+# Number of chunks whose data is stored in Redis in a single round trip
+CHUNK_STORE_BATCH_SIZE = 16
 
 
 class BaseWorker(BaseProcessingComponent):
@@ -35,33 +30,48 @@ class BaseWorker(BaseProcessingComponent):
     async def run(self) -> None:
         """Main worker loop"""
         # We handle errors in the child class function implementations.
+        # While the job cap is reached, the worker backs off exponentially. Otherwise it
+        # waits on the queue itself, and picks up new items as soon as they're pushed.
+        idle_sleep = Settings.MIN_POLL_INTERVAL
         while True:
             # Cap the number of processing jobs. We automatically delete jobs that have
             # succeeded in our Websocket endpoint, so this will mostly be running or
             # queued jobs.
-            jobs = self.get_jobs_matching_pattern(
-                namespace=self.namespace, pattern=f"{self.integration.type}-processor-"
+            num_jobs = self.count_processor_jobs(
+                namespace=self.namespace, integration_type=self.integration.type
             )
-            if len(list(jobs.keys())) > Settings.MAX_PROCESSING_JOBS:
-                await asyncio.sleep(10)
+            if num_jobs > Settings.MAX_PROCESSING_JOBS:
+                await asyncio.sleep(idle_sleep)
+                idle_sleep = min(idle_sleep * 2, Settings.MAX_POLL_INTERVAL)
                 continue
-            else:
-                parent_group_data_from_queue = self.get_next_queued_item()
-                if parent_group_data_from_queue:
-                    self.process_queued_data(parent_group_data_from_queue)
 
-                await asyncio.sleep(10)
+            idle_sleep = Settings.MIN_POLL_INTERVAL
+            parent_group_data_from_queue = await self.get_next_queued_item()
+            if parent_group_data_from_queue:
+                await self.process_queued_data(parent_group_data_from_queue)
 
-    def get_next_queued_item(self) -> ProcessingParentGroupData | None:
+    @property
+    def queue_key(self) -> str:
+        return f"queue:{self.integration.type}:{self.integration_id}"
+
+    def requeue(self, data: ProcessingParentGroupData) -> None:
+        """Put parent group data back at the front of the queue (the BRPOP end), so it's
+        the next item picked up."""
+        logger.info(f"Re-queueing {data._pretty_type} {data.id}")
+        self.redis_client.simple_rpush(self.queue_key, data.model_dump_json())
+
+    async def get_next_queued_item(self) -> ProcessingParentGroupData | None:
         """Get next item from Redis queue"""
         try:
-            # Use BLPOP to block until an item is available
-            queue_key = f"queue:{self.integration.type}:{self.integration_id}"
-            result = self.redis_client.simple_brpop(
-                queue_key, timeout=Settings.QUEUE_TIMEOUT
+            # Use BRPOP to wait until an item is available. Items are LPUSHed, so this
+            # pops them in the order they were queued.
+            result = await self.redis_client.async_brpop(
+                self.queue_key, timeout=Settings.QUEUE_TIMEOUT
             )
             if result:
-                parent_group_data = ProcessingParentGroupData(**json.loads(result[1]))
+                parent_group_data = ProcessingParentGroupData.model_validate_json(
+                    result[1]
+                )
                 if parent_group_data.namespace != self.namespace:
                     raise Exception(
                         f"Tried retrieving data from user in namespace `{parent_group_data.namespace}`! This indicates leakage in the underlying Kubernetes architecture."
@@ -89,17 +99,25 @@ class BaseWorker(BaseProcessingComponent):
             job_name = f"{self.integration.type}-processor-{chunk.k8s_parent_group_id.lower()}-{chunk.id}"
         return job_name
 
-    def launch_processing_job(self, chunk: ProcessingChunk) -> client.V1Job:
-        """Launch a job to process a chunk of messages"""
-        batch_api = client.BatchV1Api()
-        job_name = self.create_job_name(chunk)
-
-        # Store the chunk data in Redis. The chunk processor job will read the chunk
-        # data from Redis. This helps us avoid storing the chunk data (which could be
-        # quite large) in an environment variable.
-        redis_key = create_job_input_redis_key(self.namespace, job_name)
-        self.redis_client.simple_set(redis_key, chunk.model_dump_json())
+    def store_chunk_data(self, chunks: tuple[ProcessingChunk, ...]) -> None:
+        """Store the chunks' data in Redis in a single round trip. The chunk processor
+        job will read the chunk data from Redis. This helps us avoid storing the chunk
+        data (which could be quite large) in an environment variable.
+        """
+        with self.redis_client.pipeline() as pipe:
+            for chunk in chunks:
+                redis_key = create_job_input_redis_key(
+                    self.namespace, self.create_job_name(chunk)
+                )
+                pipe.set(redis_key, chunk.model_dump_json())
+            pipe.execute()
 
+    @cached_property
+    def processing_job_template(self) -> dict[str, Any]:
+        """Serialized job body shared by every chunk processing job. Only the job's name
+        and its `JOB_ID` / `CHUNK_DATA_KEY` environment variables differ between chunks,
+        so everything else is built once.
+        """
         if not isinstance(Settings.DB, PostgresDatabaseConfig):
             raise Exception("Kubernetes development requires a Postgres database!")
 
@@ -107,14 +125,9 @@ class BaseWorker(BaseProcessingComponent):
         #   1. The slack-processer image is created via the
         #      integrations.src.slack.processor.SlackMessageProcessor class.
         #   2. We use environment variables to communicate the chunk data because it's
-        #      slightly easier than using CLI arguments.
-        job_uuid = uuid4()
+        #      slightly easier than using CLI arguments. `launch_processing_job` adds
+        #      the chunk-specific ones.
         env_vars = [
-            client.V1EnvVar(name="JOB_ID", value=str(job_uuid)),
-            client.V1EnvVar(
-                name="CHUNK_DATA_KEY",
-                value=redis_key,
-            ),
             client.V1EnvVar(
                 name="INTEGRATION_ID",
                 value=self.integration_id,
@@ -128,10 +141,12 @@ class BaseWorker(BaseProcessingComponent):
         image_version = (
             "__DO_NOT_EDIT__" if Settings.MODE == DeploymentMode.PROD else "latest"
         )
+        labels = self.create_processor_labels(self.integration.type)
         job = client.V1Job(
-            metadata=client.V1ObjectMeta(name=job_name, namespace=self.namespace),
+            metadata=client.V1ObjectMeta(namespace=self.namespace, labels=labels),
             spec=client.V1JobSpec(
                 template=client.V1PodTemplateSpec(
+                    metadata=client.V1ObjectMeta(labels=labels),
                     spec=client.V1PodSpec(
                         containers=[
                             client.V1Container(
@@ -151,42 +166,54 @@ class BaseWorker(BaseProcessingComponent):
                             )
                         ],
                         restart_policy="Never",
-                    )
+                    ),
                 ),
                 backoff_limit=3,
             ),
         )
+        return self.batch_api.api_client.sanitize_for_serialization(job)
+
+    def create_processing_job_db(self, chunk: ProcessingChunk) -> ChunkProcessingJob:
+        """Database object for the chunk's processing job. We pass its ID to the
+        processor so that the processor can update its own status."""
+        return ChunkProcessingJob(
+            id=uuid4(),
+            name=self.create_job_name(chunk),
+            status=IntegrationStatus.NOT_STARTED,
+            parent_group_id=chunk.parent_group_id,
+        )
+
+    async def launch_processing_job(
+        self, chunk: ProcessingChunk, job_db: ChunkProcessingJob
+    ) -> client.V1Job:
+        """Launch a job to process a chunk of messages. The chunk's data must already be
+        stored via `store_chunk_data`, and `job_db` must already be saved."""
+        redis_key = create_job_input_redis_key(self.namespace, job_db.name)
+
+        body = copy.deepcopy(self.processing_job_template)
+        body["metadata"]["name"] = job_db.name
+        body["spec"]["template"]["spec"]["containers"][0]["env"][:0] = [
+            {"name": "JOB_ID", "value": str(job_db.id)},
+            {"name": "CHUNK_DATA_KEY", "value": redis_key},
+        ]
 
         try:
-            batch_api.create_namespaced_job(namespace=self.namespace, body=job)
-            time.sleep(1)
-
-            # Create database object. We want to pass this job ID to the processor so
-            # that the processor can update its own status.
-            job_db = ChunkProcessingJob(
-                id=job_uuid,
-                name=job_name,
-                status=IntegrationStatus.NOT_STARTED,
-                parent_group_id=chunk.parent_group_id,
+            job = await self._acall(
+                self.batch_api.create_namespaced_job,
+                namespace=self.namespace,
+                body=body,
             )
-            self.db.add(job_db)
-
         except Exception as e:
             logger.error(f"Error creating job for chunk {chunk.id}: {str(e)}")
             raise
-
         return job
 
-    def process_queued_data(
-        self, data: ProcessingParentGroupData
+    async def launch_chunk_batch(
+        self, data: ProcessingParentGroupData, chunks: tuple[ProcessingChunk, ...]
     ) -> list[client.V1Job]:
-        """Process queued data by creating chunks and launching jobs"""
-        jobs: list[client.V1Job] = []
-        flag_has_chunks = False
-        for chunk in self.create_chunks(data):
-            flag_has_chunks = True
-
-            # For mypy
+        """Store a batch of chunks' data and launch their processing jobs"""
+        # For mypy
+        for chunk in chunks:
             if not isinstance(chunk, ProcessingChunk):
                 # Set parent group and integration status to FAILED. We update the
                 # integration status based on the statuses of all associated parent
@@ -198,10 +225,75 @@ class BaseWorker(BaseProcessingComponent):
                     f"Unexpected type for chunk: {chunk.__class__.__name__}"
                 )
 
-            # Launch processing job. We will use a Websocket to get the status of these
-            # jobs.
-            job = self.launch_processing_job(chunk)
-            jobs.append(job)
+        # Launch processing jobs. We will use a Websocket to get the status of these
+        # jobs. The batch's rows are inserted with a single statement before any job is
+        # created, since the processors update their own rows as soon as they start.
+        # Jobs are then created concurrently; jobs that were created are kept even if
+        # others in the batch fail, and the rows of the failed ones are deleted.
+        self.store_chunk_data(chunks)
+        job_dbs = [self.create_processing_job_db(chunk) for chunk in chunks]
+        self.db.add_many(job_dbs)
+        results = await asyncio.gather(
+            *[
+                self.launch_processing_job(chunk, job_db)
+                for chunk, job_db in zip(chunks, job_dbs, strict=True)
+            ],
+            return_exceptions=True,
+        )
+        self.db.delete_by_ids(
+            ChunkProcessingJob,
+            [
+                job_db.id
+                for job_db, result in zip(job_dbs, results, strict=True)
+                if isinstance(result, BaseException)
+            ],
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return [r for r in results if not isinstance(r, BaseException)]
+
+    async def process_queued_data(
+        self, data: ProcessingParentGroupData
+    ) -> list[client.V1Job]:
+        """Process queued data by creating chunks and launching jobs"""
+        jobs: list[client.V1Job] = []
+        flag_has_chunks = False
+
+        # Chunks are built lazily. The next batch is built in a thread while the current
+        # batch's jobs are launched, so chunk creation (e.g., API calls) overlaps with
+        # job creation.
+        batches = batched(
+            self.create_chunks(data), CHUNK_STORE_BATCH_SIZE, strict=False
+        )
+        next_batch = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+        raised: Exception | None = None
+        try:
+            # Shield the prefetch, so that cancelling this task doesn't orphan the
+            # running thread; it's drained below instead.
+            while (chunks := await asyncio.shield(next_batch)) is not None:
+                flag_has_chunks = True
+                next_batch = asyncio.ensure_future(
+                    asyncio.to_thread(next, batches, None)
+                )
+                jobs.extend(await self.launch_chunk_batch(data, chunks))
+        except asyncio.CancelledError:
+            # The worker is shutting down before every chunk was launched. Put the
+            # parent group back on the queue so the unlaunched chunks aren't lost.
+            self.requeue(data)
+            raise
+        except Exception as e:
+            raised = e
+            raise
+        finally:
+            # A thread can't be interrupted, so wait for the prefetch to finish rather
+            # than leave it building chunks in the background. Its batch (if any) is
+            # dropped: on errors, the parent group is marked as FAILED by the caller.
+            # If the prefetch's own error is the one being raised, it isn't discarded.
+            await asyncio.wait([next_batch])
+            prefetch_error = next_batch.exception()
+            if prefetch_error is not None and prefetch_error is not raised:
+                logger.warning(f"Discarding chunk prefetch error: {prefetch_error}")
 
         # If the parent group has chunks, then change the status to RUNNING. Otherwise,
         # change the status to SUCCESS.
@@ -212,6 +304,6 @@ class BaseWorker(BaseProcessingComponent):
             status=IntegrationStatus.RUNNING
             if flag_has_chunks
             else IntegrationStatus.SUCCESS,
-            last_run=datetime.now(),
+            last_run=func.now(),
         )
         return jobs
@@ -1,13 +1,27 @@
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Generator
 
-import requests
+import httpx
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from app.processors.integrations.github.types import GithubSecret
 from app.processors.utils import download_file
 
+# Pages fetched concurrently, once the first page tells us how many pages there are
+PAGE_FETCH_CONCURRENCY = 8
+
+# With this many (or fewer) requests left in the rate limit window, fetch one page at a
+# time
+RATE_LIMIT_FLOOR = 10
+
+# Page number of the `rel="last"` link in a `Link` header
+_LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
 
 class GithubClient(BaseModel):
     """Super simple Github API client. Allows a bit more flexibility than PyGithub."""
@@ -17,6 +31,7 @@ class GithubClient(BaseModel):
 
     _url: str = PrivateAttr()
     _headers: dict[str, str] = PrivateAttr()
+    _client: httpx.Client = PrivateAttr()
 
     @model_validator(mode="after")
     def define_base_url_and_headers(self) -> "GithubClient":
@@ -25,17 +40,28 @@ class GithubClient(BaseModel):
             "Accept": "application/vnd.github.v3+json",
             "Authorization": f"Bearer {self.secret.token}",
         }
+        # One pooled client, so that requests reuse connections (and TLS sessions)
+        self._client = httpx.Client(
+            headers=self._headers,
+            limits=httpx.Limits(
+                max_connections=PAGE_FETCH_CONCURRENCY * 2,
+                max_keepalive_connections=PAGE_FETCH_CONCURRENCY * 2,
+            ),
+        )
         return self
 
+    def _get(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        resp = self._client.get(url, params=params)
+        if resp.status_code != 200:
+            error_msg = f"Failed to fetch data from {url} with status code {resp.status_code}: {resp.text}"
+            raise Exception(error_msg)
+        return resp
+
     def execute_simple_get_request(self, url: str) -> list[dict[str, Any]]:
         """
         Execute simple GET request to Github REST API.
         """
-        resp = requests.get(url, headers=self._headers)
-        if resp.status_code != 200:
-            error_msg = f"Failed to fetch data from {url} with status code {resp.status_code}: {resp.text}"
-            raise Exception(error_msg)
-        data = resp.json()
+        data = self._get(url).json()
         if isinstance(data, dict):
             return [data] if data else []
         elif isinstance(data, list):
@@ -49,28 +75,41 @@ class GithubClient(BaseModel):
         self, url: str, params: dict[str, Any]
     ) -> Generator[list[dict[str, Any]], None, None]:
         """
-        Handle pagination with the Github REST API.
-        """
-        has_more = True
-        page = 1
-        while has_more:
-            params["page"] = page
-            resp = requests.get(url, headers=self._headers, params=params)
-
-            # Handle errors
-            if resp.status_code != 200:
-                error_msg = f"Failed to fetch data from {url} with status code {resp.status_code}: {resp.text}"
-                raise Exception(error_msg)
-            data = resp.json()
-            yield data
-
-            # Check if there are more
-            headers_link = resp.headers.get("link", "")
-            if headers_link and 'rel="next"' in headers_link:
-                has_more = True
+        Handle pagination with the Github REST API. Pages are yielded in order. When the
+        first page links to the last page, the remaining pages are fetched
+        concurrently.
+        """
+        resp = self._get(url, {**params, "page": 1})
+        yield resp.json()
+
+        headers_link = resp.headers.get("link", "")
+        last_page_match = _LAST_PAGE_RE.search(headers_link)
+        if not last_page_match:
+            # Without a `last` link, follow the `next` links one page at a time
+            page = 1
+            while 'rel="next"' in headers_link:
                 page += 1
-            else:
-                has_more = False
+                resp = self._get(url, {**params, "page": page})
+                yield resp.json()
+                headers_link = resp.headers.get("link", "")
+            return
+
+        remaining = int(resp.headers.get("x-ratelimit-remaining", RATE_LIMIT_FLOOR))
+        concurrency = PAGE_FETCH_CONCURRENCY if remaining > RATE_LIMIT_FLOOR else 1
+        pages = iter(range(2, int(last_page_match.group(1)) + 1))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Keep `concurrency` pages in flight, and yield them in order
+            in_flight: deque[Future[httpx.Response]] = deque(
+                executor.submit(self._get, url, {**params, "page": page})
+                for page in islice(pages, concurrency)
+            )
+            while in_flight:
+                resp = in_flight.popleft().result()
+                for page in islice(pages, 1):
+                    in_flight.append(
+                        executor.submit(self._get, url, {**params, "page": page})
+                    )
+                yield resp.json()
 
     def get_repos(self) -> list[dict[str, Any]]:
         """
@@ -1,7 +1,5 @@
-import json
 import logging
 import os
-import sys
 from pathlib import Path
 from typing import Any, Tuple
 from urllib.parse import urlparse
@@ -22,6 +20,7 @@ from app.processors.integrations.github.types import (
     GithubProcessingChunk,
     GithubSecret,
 )
+from app.processors.utils import configure_logging
 from app.rag.types import (
     EdgeRelationship,
     NodeLabel,
@@ -29,18 +28,9 @@ from app.rag.types import (
 from app.settings import Settings
 
 # Logger
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
-# Send logs to stdout
-ch = logging.StreamHandler(sys.stdout)
-ch.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
-logger.addHandler(ch)
-
-
 class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
     """Processes chunks of GitHub PRs and issues."""
 
@@ -111,7 +101,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                 display_name="GitHub Comment",
                 reactions=comment_reactions_list,
             )
-            self.graph_client.add_node(comment_node)
+            self.queue_node(comment_node)
 
             # Files
             self._process_file_links_and_perform_entity_resolution(
@@ -124,7 +114,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                 to_node_id=comment_id,
                 relationship_type=EdgeRelationship.HAS,
             )
-            self.graph_client.add_edge(pr_has_comment_edge)
+            self.queue_edge(pr_has_comment_edge)
 
     @staticmethod
     def _get_file_name_type_from_github_url(url: str) -> Tuple[str, str]:
@@ -161,7 +151,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                     mimetype=file_ext,
                     url=link.url,
                 )
-                self.graph_client.add_node(file_node)
+                self.queue_node(file_node)
 
                 # Parent node has this file
                 parent_node_has_file_edge = Edge(
@@ -169,11 +159,11 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                     to_node_id=link.url,
                     relationship_type=EdgeRelationship.HAS,
                 )
-                self.graph_client.add_edge(parent_node_has_file_edge)
+                self.queue_edge(parent_node_has_file_edge)
 
             # Otherwise, perform entity resolution via the link.
             else:
-                link_nodes = self.graph_client.get_nodes_from_url(link.url)
+                link_nodes = self.get_nodes_from_url(link.url)
 
                 # If the node doesn't exist (e.g., if a GitHub PR is references a new Slack
                 # thread we have not parsed), then create a temporary node. We will update
@@ -192,13 +182,13 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                         display_name="",
                         reactions=[],
                     )
-                    self.graph_client.add_node(temporary_node_for_message_link)
+                    self.queue_node(temporary_node_for_message_link)
                     entities_are_associated = Edge(
                         from_node_id=from_node_id,
                         to_node_id=link.url,
                         relationship_type=EdgeRelationship.LINKED_TO,
                     )
-                    self.graph_client.add_edge(entities_are_associated)
+                    self.queue_edge(entities_are_associated)
 
                 else:
                     for node in link_nodes:
@@ -207,7 +197,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                             to_node_id=node["id"],
                             relationship_type=EdgeRelationship.LINKED_TO,
                         )
-                        self.graph_client.add_edge(entities_are_associated)
+                        self.queue_edge(entities_are_associated)
 
     def _construct_pr_issue_id(self, content_type: ContentType, pr_issue_number: int):
         """Construct PR / issue ID. Used for node IDs and embedding IDs."""
@@ -258,7 +248,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
             display_name="GitHub Issue",
             reactions=issue_reactions_list,
         )
-        self.graph_client.add_node(issue_node)
+        self.queue_node(issue_node)
 
         # Files
         self._process_file_links_and_perform_entity_resolution(
@@ -315,7 +305,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
             display_name="GitHub PR",
             reactions=pr_reactions_list,
         )
-        self.graph_client.add_node(pr_node)
+        self.queue_node(pr_node)
 
         # Determine if the links are files. If they are, then add those nodes /
         # relationships to the graph.
@@ -334,7 +324,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                 source=IntegrationType.GITHUB,
                 name_login=pr_creator_user_info.get("name", "") or pr_creator,
             )
-            self.graph_client.add_node(pr_creator_node)
+            self.queue_node(pr_creator_node)
 
             # User created PR edge
             user_created_pr_edge = Edge(
@@ -342,7 +332,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                 to_node_id=pr_id,
                 relationship_type=EdgeRelationship.CREATED,
             )
-            self.graph_client.add_edge(user_created_pr_edge)
+            self.queue_edge(user_created_pr_edge)
 
         # Issue
         pr_issue_url = pr.get("issue_url")
@@ -367,7 +357,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                     to_node_id=pr_id,
                     relationship_type=EdgeRelationship.LINKED_TO,
                 )
-                self.graph_client.add_edge(pr_addresses_issue_edge)
+                self.queue_edge(pr_addresses_issue_edge)
 
         # PR comments
         pr_review_comments_url: str | None = pr.get("review_comments_url")
@@ -457,9 +447,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
                         "user_namespace": self.namespace,
                         "exception_tb": str(e),
                     }
-                    logger.error(
-                        f"Could not download document: {json.dumps(error_metadata)}"
-                    )
+                    logger.error("Could not download document: %s", error_metadata)
 
         self.vector_db.process_documents(
             namespace=self.namespace,
@@ -475,6 +463,7 @@ class GithubProcessor(BaseProcessor[GithubProcessingChunk]):
 
 
 if __name__ == "__main__":
+    configure_logging()
     container = Container()
     container.init_resources()
 
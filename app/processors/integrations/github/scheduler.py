@@ -1,6 +1,5 @@
 import logging
 import os
-import sys
 
 from fastapi import HTTPException
 
@@ -13,18 +12,11 @@ from app.processors.base.scheduler import BaseScheduler
 from app.processors.base.types import ProcessingParentGroupData
 from app.processors.integrations.github.api import GithubClient
 from app.processors.integrations.github.types import GithubSecret
+from app.processors.utils import configure_logging
 
 # Logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Send logs to stdout
-ch = logging.StreamHandler(sys.stdout)
-ch.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
-logger.addHandler(ch)
-
 
 class GithubScheduler(BaseScheduler):
     """
@@ -123,6 +115,7 @@ class GithubScheduler(BaseScheduler):
 
 
 if __name__ == "__main__":
+    configure_logging()
     container = Container()
     container.init_resources()
 
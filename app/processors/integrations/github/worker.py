@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import os
-import sys
 from typing import Any, Generator
 
 from app.clients.redis_client import RedisClient
@@ -16,19 +15,12 @@ from app.processors.integrations.github.types import (
     GithubProcessingChunk,
     GithubSecret,
 )
+from app.processors.utils import configure_logging
 from app.settings import Settings
 
 # Logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Send logs to stdout
-ch = logging.StreamHandler(sys.stdout)
-ch.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
-logger.addHandler(ch)
-
 
 class GithubWorker(BaseWorker):
     """Worker for processing Slack channels"""
@@ -165,6 +157,7 @@ class GithubWorker(BaseWorker):
 
 
 if __name__ == "__main__":
+    configure_logging()
     container = Container()
     container.init_resources()
 
@@ -1,8 +1,6 @@
-import json
 import logging
 import os
 import re
-import sys
 from pathlib import Path
 from typing import Any, Tuple
 
@@ -20,23 +18,14 @@ from app.processors.base.types import ProcessingChunk
 from app.processors.integrations.slack.types import (
     SlackSecret,
 )
-from app.processors.utils import download_file
+from app.processors.utils import configure_logging, download_file
 from app.rag.types import EdgeRelationship, NodeLabel
 from app.settings import Settings
 
 # Logger
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
-# Send logs to stdout
-ch = logging.StreamHandler(sys.stdout)
-ch.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
-logger.addHandler(ch)
-
-
 class SlackProcessor(BaseProcessor[ProcessingChunk]):
     """Processes chunks of Slack messages."""
 
@@ -274,7 +263,7 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
                     source=IntegrationType.SLACK,
                     name_login=user_info.get("name", ""),
                 )
-                self.graph_client.add_node(user_node)
+                self.queue_node(user_node)
 
         # Message node. For the node properties, remove `blocks` and `files`. These are
         # processed separately.
@@ -296,13 +285,13 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
             display_name="Slack Message",
             reactions=[r["name"] for r in message.get("reactions", [])],
         )
-        self.graph_client.add_node(message_node)
+        self.queue_node(message_node)
 
         # Entity resolution. Message links are in the form:
         # {'type': 'link', 'url': '...}
         message_links = self.grab_non_text_message_elements(blocks, "link")
         for link in message_links:
-            link_nodes = self.graph_client.get_nodes_from_url(link["url"])
+            link_nodes = self.get_nodes_from_url(link["url"])
 
             # If the node doesn't exist (e.g., if a GitHub PR is references a new Slack
             # thread we have not parsed), then create a temporary node. We will update
@@ -321,13 +310,13 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
                     display_name="",
                     reactions=[],
                 )
-                self.graph_client.add_node(temporary_node_for_message_link)
+                self.queue_node(temporary_node_for_message_link)
                 entities_are_associated = Edge(
                     from_node_id=message_id,
                     to_node_id=link["url"],
                     relationship_type=EdgeRelationship.LINKED_TO,
                 )
-                self.graph_client.add_edge(entities_are_associated)
+                self.queue_edge(entities_are_associated)
 
             else:
                 for node in link_nodes:
@@ -336,7 +325,7 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
                         to_node_id=node["id"],
                         relationship_type=EdgeRelationship.LINKED_TO,
                     )
-                    self.graph_client.add_edge(entities_are_associated)
+                    self.queue_edge(entities_are_associated)
 
         # Files
         for message_file in files:
@@ -349,7 +338,7 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
                 mimetype=message_file["mimetype"],
                 url=message_file["url_private"],
             )
-            self.graph_client.add_node(file_node)
+            self.queue_node(file_node)
 
         # Replies
         if "thread_ts" in message and message["thread_ts"] == message["ts"]:
@@ -377,7 +366,7 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
                 to_node_id=message_id,
                 relationship_type=EdgeRelationship.HAS,
             )
-            self.graph_client.add_edge(parent_message_has_reply_edge)
+            self.queue_edge(parent_message_has_reply_edge)
 
         # User posted the message
         if user_id:
@@ -386,7 +375,7 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
                 to_node_id=message_id,
                 relationship_type=EdgeRelationship.CREATED,
             )
-            self.graph_client.add_edge(user_posted_message_edge)
+            self.queue_edge(user_posted_message_edge)
 
         # Message has file
         for _file in files:
@@ -395,7 +384,7 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
                 to_node_id=_file["id"],
                 relationship_type=EdgeRelationship.HAS,
             )
-            self.graph_client.add_edge(message_has_file_edge)
+            self.queue_edge(message_has_file_edge)
 
     def save_chunk_graph_entities(self, content: dict[str, Any]):
         self.save_message_graph_entities(content)
@@ -456,9 +445,7 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
                         "user_namespace": self.namespace,
                         "exception_tb": str(e),
                     }
-                    logger.error(
-                        f"Could not download document: {json.dumps(error_metadata)}"
-                    )
+                    logger.error("Could not download document: %s", error_metadata)
 
         self.vector_db.process_documents(
             namespace=self.namespace,
@@ -474,6 +461,7 @@ class SlackProcessor(BaseProcessor[ProcessingChunk]):
 
 
 if __name__ == "__main__":
+    configure_logging()
     container = Container()
     container.init_resources()
 
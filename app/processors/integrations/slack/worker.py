@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import os
-import sys
 from typing import Any, Generator
 
 from slack_sdk import WebClient
@@ -14,19 +13,12 @@ from app.db.models.choices import IntegrationStatus
 from app.processors.base.types import ProcessingChunk, ProcessingParentGroupData
 from app.processors.base.worker import BaseWorker
 from app.processors.integrations.slack.types import SlackSecret
+from app.processors.utils import configure_logging
 from app.settings import Settings
 
 # Logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Send logs to stdout
-ch = logging.StreamHandler(sys.stdout)
-ch.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-ch.setFormatter(formatter)
-logger.addHandler(ch)
-
 
 class SlackWorker(BaseWorker):
     """Worker for processing Slack channels"""
@@ -138,6 +130,7 @@ class SlackWorker(BaseWorker):
 
 
 if __name__ == "__main__":
+    configure_logging()
     container = Container()
     container.init_resources()
 
@@ -1,15 +1,24 @@
 import logging
 import os
+import sys
 from pathlib import Path
 
 import requests
 from humanfriendly import format_size
 
 # Logger
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
+def configure_logging() -> None:
+    """Send INFO+ logs to stdout. Called once by each processing entrypoint."""
+    logging.basicConfig(
+        level=logging.INFO,
+        stream=sys.stdout,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
 def create_job_input_redis_key(namespace: str, job_name: str):
     return f"{namespace}-{job_name}"
 
@@ -4,6 +4,7 @@ from typing import Any
 from uuid import UUID
 
 from jinja2 import Environment, FileSystemLoader, Template
+from neo4j import RoutingControl
 from pinecone import Pinecone
 from pinecone.db_data.index import Index
 from pydantic import BaseModel, ConfigDict, Field
@@ -20,7 +21,7 @@ from pydantic_ai.providers.groq import GroqProvider
 from pydantic_ai.providers.mistral import MistralProvider
 from pydantic_ai.providers.openai import OpenAIProvider
 
-from app.clients.graph_client import GraphClient
+from app.clients.graph_client import NODE_LABELS, GraphClient
 from app.clients.mongodb_client import DocumentStoreClient
 from app.clients.redis_client import RedisClient
 from app.db.models.choices import ChatModelProvider
@@ -274,13 +275,15 @@ class RagAgent:
         # Use two hops in order to retrieve data
         cypher = "\n".join(
             [
-                "MATCH (n) WHERE n.id IN $ids ",
+                f"MATCH (n:{NODE_LABELS}) WHERE n.id IN $ids ",
                 "OPTIONAL MATCH (n)-[r*1..2]->(m) ",
                 "OPTIONAL MATCH (p)-[r2:LINKED_TO|HAS*1..2]->(n) ",
                 "RETURN n, labels(n) as n_labels, m, labels(m) as m_labels, p, labels(p) as p_labels",
             ]
         )
-        graph_data = self.neo4j.execute_query(cypher_query=cypher, ids=node_id_set)
+        graph_data = self.neo4j.execute_query(
+            cypher_query=cypher, routing_=RoutingControl.READ, ids=node_id_set
+        )
 
         # Sort to ensure that the order of graph IDs matches the order sent by Pinecone.
         # Then, process the Text and Person nodes.
@@ -6,7 +6,6 @@ from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
-from kubernetes import config
 from passlib.context import CryptContext
 from starlette.status import HTTP_400_BAD_REQUEST, HTTP_403_FORBIDDEN
 
@@ -14,15 +13,11 @@ from app.clients.k8s_client import KubernetesOperator
 from app.db.container import Container
 from app.db.factory import Database
 from app.db.models import User
-from app.db.security import create_access_token, get_current_user
+from app.db.security import create_access_token, evict_cached_user, get_current_user
 from app.rest_api.types.input_types import ExistingUserDataInput, NewUserDataInput
 from app.rest_api.types.response_model_types import Token
 from app.rest_api.utils import get_non_null_attributes_from_data
 
-# Kubernetes client
-config.incluster_config.load_incluster_config()
-
-
 # Logger
 logger = logging.getLogger(__file__)
 
@@ -91,14 +86,10 @@ async def signup(
     # Create namespace
     k8s_operator = KubernetesOperator()
     namespace = slugify.slugify(f"{data.first_name} {data.last_name} {data.username}")
-    k8s_operator.create_namespace(namespace)
 
     # Create an "all access" role and bind this to the default service account.
     # TODO – provide better role-based permissions
-    role = k8s_operator.create_all_access_rbac_role(namespace)
-    k8s_operator.create_role_binding(
-        namespace, "default", role_name=k8s_operator.get_name_from_metadata(role)
-    )
+    await k8s_operator.provision_namespace(namespace, "default")
 
     # Create user
     user = User(
@@ -163,6 +154,7 @@ async def partial_update_user(
         },
         **non_null_attributes,
     )
+    evict_cached_user(id)
 
     # Return new token if needed
     if "username" in non_null_attributes:
@@ -188,9 +180,10 @@ async def delete_user(
         )
     user_to_delete = db.get_object(db_type=User, where_conditions={"id": id})
     db.delete(user_to_delete)
+    evict_cached_user(id)
 
     # Delete user namespace. Not recommended to use mixins class directly, but
     # whatever...
     k8s_operator = KubernetesOperator()
-    k8s_operator.destroy_namespace(user_to_delete.namespace)
+    await k8s_operator.adestroy_namespace(user_to_delete.namespace)
     return {"status_code": 202, "detail": f"User `{id}` successfully deleted!"}
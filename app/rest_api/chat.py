@@ -7,7 +7,6 @@ from uuid import UUID
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Query, WebSocket
 from fastapi.exceptions import HTTPException
-from kubernetes import config
 from pinecone import Pinecone
 from pydantic_ai import Agent
 from pydantic_ai.messages import (
@@ -50,10 +49,6 @@ from app.settings import Settings
 logger = logging.getLogger(__name__)
 
 
-# Kubernetes client
-config.incluster_config.load_incluster_config()
-
-
 router = APIRouter()
 
 
@@ -100,7 +95,7 @@ async def create_chat(
                 count += 1
         if count < len(query_split):
             title += "..."
-        ts = str(datetime.now(timezone.utc).timestamp())
+        ts = datetime.now(timezone.utc).timestamp()
         c = Chat(
             user_id=user.id,
             namespace=user.namespace,
@@ -248,7 +243,7 @@ async def websocket_chat_completion(
 
         # Secret
         operator = KubernetesOperator()
-        secret_data = operator.read_namespaced_secret(
+        secret_data = await operator.aread_namespaced_secret(
             namespace=namespace,
             secret_name=chat_completion_input.chat_model_secret_slug,
         )
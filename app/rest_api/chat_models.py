@@ -5,7 +5,6 @@ from uuid import UUID
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
-from kubernetes import config
 from sqlmodel import select
 from starlette.status import HTTP_202_ACCEPTED, HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
 
@@ -26,10 +25,6 @@ from app.rest_api.utils import get_non_null_attributes_from_data
 logger = logging.getLogger(__name__)
 
 
-# Kubernetes client
-config.incluster_config.load_incluster_config()
-
-
 router = APIRouter()
 
 
@@ -141,7 +136,7 @@ async def delete_chat_model(
 
         # Destory the secret in Kubernetes and the database
         k8s_operator = KubernetesOperator()
-        k8s_operator.destroy_secret(
+        await k8s_operator.adestroy_secret(
             namespace=user.namespace, secret_name=chat_model_to_delete.secret.slug
         )
         db.delete(chat_model_to_delete.secret)
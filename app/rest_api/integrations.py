@@ -7,7 +7,6 @@ from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, BackgroundTasks, Depends, WebSocket, WebSocketDisconnect
 from fastapi.exceptions import HTTPException
 from fastapi_pagination import Page
-from kubernetes import config
 from starlette.status import HTTP_202_ACCEPTED
 
 from app.clients.graph_client import GraphClient
@@ -35,10 +34,6 @@ from app.settings import DeploymentMode, Settings
 logger = logging.getLogger(__name__)
 
 
-# Kubernetes client
-config.incluster_config.load_incluster_config()
-
-
 router = APIRouter()
 
 
@@ -251,21 +246,28 @@ def delete_integration(
             # No need to explicitly delete the database object. This is handled by our
             # cascade relationship.
 
-        # Delete all jobs
+        # Delete all jobs. Jobs and pods created before processor jobs were labeled
+        # are matched on their name prefix instead.
+        processor_selector = k8s_operator.create_label_selector(
+            k8s_operator.create_processor_labels(integration.type)
+        )
+        legacy_name_prefix = f"{integration.type}-processor-"
         background_tasks.add_task(
             k8s_operator.async_delete_jobs,
             namespace=user.namespace,
-            pattern=f"{integration.type}-processor",
+            label_selector=processor_selector,
+            legacy_name_prefix=legacy_name_prefix,
         )
         background_tasks.add_task(
             k8s_operator.async_delete_cron_jobs,
             namespace=user.namespace,
-            pattern=f"{integration.type}-processor",
+            label_selector=processor_selector,
         )
         background_tasks.add_task(
             k8s_operator.async_delete_pods,
             namespace=user.namespace,
-            pattern=f"{integration.type}-processor",
+            label_selector=processor_selector,
+            legacy_name_prefix=legacy_name_prefix,
         )
 
         # Delete graph and vector data. This is asynchornous
@@ -1,10 +1,8 @@
 import logging
-from datetime import datetime
 from typing import Any
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends
-from kubernetes import config
 from slugify import slugify
 from starlette.status import HTTP_202_ACCEPTED
 
@@ -20,10 +18,6 @@ from app.rest_api.utils import get_non_null_attributes_from_data
 logger = logging.getLogger(__name__)
 
 
-# Kubernetes client
-config.incluster_config.load_incluster_config()
-
-
 router = APIRouter()
 
 
@@ -61,7 +55,6 @@ async def update_secret(
     # Original secret
     original_secret = db.get_object(db_type=Secret, where_conditions={"id": id})
     non_null_attributes = get_non_null_attributes_from_data(data, exclude=["data"])
-    non_null_attributes["updated_at"] = datetime.now()
     updated_secret = db.update_object(
         db_type=Secret, where_conditions={"id": id}, **non_null_attributes
     )
@@ -73,7 +66,7 @@ async def update_secret(
     secret_data = (
         data.data
         if data.data is not None and data.data
-        else operator.read_namespaced_secret(
+        else await operator.aread_namespaced_secret(
             namespace=user.namespace, secret_name=original_secret.slug
         )
     )
@@ -81,10 +74,12 @@ async def update_secret(
 
     # If the name has changed, then delete the existing secret
     if "name" in non_null_attributes:
-        operator.destroy_secret(namespace=user.namespace, secret_name=secret_name)
+        await operator.adestroy_secret(
+            namespace=user.namespace, secret_name=secret_name
+        )
 
     # Update the secret in Kubernetes
-    operator.create_or_update_secret(
+    await operator.acreate_or_update_secret(
         namespace=user.namespace,
         secret_name=secret_name,
         secret_data=secret_data,
@@ -103,7 +98,7 @@ async def create_secret(
 ) -> Secret:
     secret_slug = slugify(data.name)
     operator = KubernetesOperator()
-    operator.create_or_update_secret(
+    await operator.acreate_or_update_secret(
         namespace=user.namespace,
         secret_name=secret_slug,
         secret_data=data.data,
@@ -134,7 +129,9 @@ async def delete_secret(
 
     # Delete Kubernetes secret and database object
     operator = KubernetesOperator()
-    operator.destroy_secret(namespace=user.namespace, secret_name=secret_to_delete.slug)
+    await operator.adestroy_secret(
+        namespace=user.namespace, secret_name=secret_to_delete.slug
+    )
 
     db.delete(secret_to_delete)
 
@@ -58,11 +58,11 @@ def update_parent_group_status(
             # `SUCCESS`, so no need to set it here.
             operator.async_delete_jobs(
                 namespace=namespace,
-                pattern=job.name,
+                field_selector=f"metadata.name={job.name}",
             )
             operator.async_delete_pods(
                 namespace=namespace,
-                pattern=job.name,
+                label_selector=f"job-name={job.name}",
             )
 
         job_statuses.append(status)
@@ -2,7 +2,9 @@ import re
 from abc import ABC, abstractmethod
 from enum import StrEnum
 from pathlib import Path
+from urllib.parse import urlencode
 
+import orjson
 from pydantic import BaseModel, Field, SecretStr, model_validator
 from pydantic_core import ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -81,12 +83,20 @@ class MongoDbCredentials(BaseModel):
         if mode == DeploymentMode.DEV:
             self.HOST = use_fqdn(self.HOST)
 
+    def create_connection_uri(self) -> str:
+        host = self.HOST if self.PORT is None else f"{self.HOST}:{self.PORT}"
+        options = (
+            "" if self.OPTIONS is None else "?" + urlencode(orjson.loads(self.OPTIONS))
+        )
+        return f"{self.DRIVER}://{self.USER}:{self.PASSWORD}@{host}/{options}"
+
 
 class Neo4JCredentials(BaseModel):
     DRIVER: str = Field(default="neo4j")
     USER: str
     PASSWORD: str
     HOST: str
+    DATABASE: str = Field(default="neo4j")
 
     def define_host(self, mode: DeploymentMode):
         # In dev, we deploy Neo4J as a Kubernetes deployment/service
@@ -123,10 +133,16 @@ class _Settings(BaseSettings):
     CLIENT_ORIGIN: str = Field(default="http://localhost:5173")
     # Redis Queue timeout
     QUEUE_TIMEOUT: int = 30
+    # Bounds (in seconds) of the worker's backoff when it has no work to pick up
+    MIN_POLL_INTERVAL: float = 0.1
+    MAX_POLL_INTERVAL: float = 10
     # Objects to include in a single processing job
     MAX_OBJECTS_IN_JOB: int = 1000
     # Max number of processing jobs
     MAX_PROCESSING_JOBS: int = 2
+    # Worker processes used to convert documents. Each one loads its own converter and
+    # tokenizer, so keep this small.
+    MAX_CONVERSION_PROCESSES: int = 2
     # Redis host
     REDIS: RedisCredentials
     # MongoDB credentials
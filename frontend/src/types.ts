@@ -129,7 +129,7 @@ export interface Chat {
   chat_id: string;
   title: string;
   query: string;
-  ts: string;
+  ts: number;
 }
 
 export interface TextNode {
@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlmodel import SQLModel
+
+import app.db.models  # noqa: F401
+from app.db.factory import Database
+from app.db.models.auth import User
+from app.db.models.choices import IntegrationType, SecretType
+from app.db.models.integration import Integration
+from app.db.models.k8s import Secret
+
+
+class RelationshipLookupTest(unittest.TestCase):
+    """Lookups keyed on a relationship (e.g., `{"user": user}`) filter on the
+    relationship's foreign key."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = Database(f"sqlite:///{Path(self.tmpdir.name) / 'test.db'}")
+        SQLModel.metadata.create_all(self.db._engine)
+
+        self.users = [
+            self.db.add(
+                User(
+                    username=f"user{i}@example.com",
+                    hashed_password="hashed",
+                    first_name="First",
+                    last_name="Last",
+                    namespace=f"namespace-{i}",
+                )
+            )
+            for i in range(2)
+        ]
+        for user in self.users:
+            secret = self.db.add(
+                Secret(
+                    type=SecretType.SLACK_WEB_TOKEN,
+                    name=f"secret-{user.namespace}",
+                    slug=f"secret-{user.namespace}",
+                    namespace=user.namespace,
+                )
+            )
+            self.db.add(
+                Integration(
+                    name=f"integration-{user.namespace}",
+                    type=IntegrationType.SLACK,
+                    refresh_schedule="0 0 * * *",
+                    user_id=user.id,
+                    secret_id=secret.id,
+                )
+            )
+
+    def tearDown(self):
+        self.db._engine.dispose()
+        self.tmpdir.cleanup()
+
+    def test_all_objects(self):
+        integrations = self.db.all_objects(Integration, {"user": self.users[0]})
+        self.assertEqual([i.user_id for i in integrations], [self.users[0].id])
+
+    def test_get_object(self):
+        integration = self.db.get_object(
+            Integration, {"user": self.users[1], "type": IntegrationType.SLACK}
+        )
+        self.assertEqual(integration.user_id, self.users[1].id)
+
+    def test_count_objects(self):
+        self.assertEqual(self.db.count_objects(Integration, {"user": self.users[0]}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()